@@ -55,6 +55,10 @@ spec:
             value: "{{ .Values.webservice.skip_images }}"
           - name: "IMAGES_CONFIG_REFRESH_INTERVAL"
             value: "{{ .Values.webservice.images_config_refresh_interval }}"
+          - name: "HARBOR_CACHE_TTL"
+            value: "{{ .Values.webservice.harbor_cache_ttl }}"
+          - name: "QUOTAS_CACHE_TTL"
+            value: "{{ .Values.webservice.quotas_cache_ttl }}"
           - name: "DEFAULT_CPU_LIMIT"
             value: "{{ .Values.webservice.default_cpu_limit }}"
           {{- with .Values.loki.url }}
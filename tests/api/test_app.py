@@ -12,6 +12,7 @@ from toolforge_weld.errors import ToolforgeUserError
 from tests.helpers.fakes import get_dummy_job
 from tjf.api.app import error_handler
 from tjf.api.models import (
+    EMPTY_RESPONSE_MESSAGES,
     JobListResponse,
     JobResponse,
     NewContinuousJob,
@@ -394,6 +395,26 @@ class TestJobsEndpoint:
         assert response_json is not None, "Response JSON is None"
         assert expected_message in response_json["messages"]["warning"]
 
+    def test_warning_message_does_not_leak_into_shared_empty_messages(
+        self,
+        client: TestClient,
+        app: JobsApi,
+        monkeypatch: MonkeyPatch,
+        fake_auth_headers: dict[str, str],
+    ) -> None:
+        dummy_job = get_dummy_job(status={"up_to_date": False})
+        monkeypatch.setattr(
+            app.core,
+            "get_jobs",
+            value=lambda *args, **kwargs: [dummy_job],
+        )
+        gotten_response = client.get(
+            "/v1/tool/some-tool/jobs/", headers=fake_auth_headers
+        )
+
+        assert gotten_response.status_code == http.HTTPStatus.OK
+        assert EMPTY_RESPONSE_MESSAGES == ResponseMessages()
+
 
 class TestApiGetJob:
     def test_skips_unset_fields_for_continuous_job(
@@ -649,3 +670,36 @@ class TestApiUpdateJob:
         assert (
             UpdateResponse.model_validate(actual_response.json()) == expected_response
         )
+
+
+class TestApiMessagesOnlyResponses:
+    @pytest.mark.parametrize(
+        "method, path, core_method",
+        [
+            ["delete", "/v1/tool/some-tool/jobs/silly-job-name", "delete_job"],
+            ["post", "/v1/tool/some-tool/jobs/silly-job-name/restart", "restart_job"],
+            ["delete", "/v1/tool/some-tool/jobs", "flush_jobs"],
+        ],
+    )
+    def test_returns_empty_messages(
+        self,
+        client: TestClient,
+        app: JobsApi,
+        monkeypatch: MonkeyPatch,
+        fake_auth_headers: dict[str, str],
+        method: str,
+        path: str,
+        core_method: str,
+    ) -> None:
+        monkeypatch.setattr(
+            app.core, "get_job", value=lambda *args, **kwargs: get_dummy_job()
+        )
+        monkeypatch.setattr(app.core, core_method, value=lambda *args, **kwargs: None)
+
+        gotten_response = client.request(method, path, headers=fake_auth_headers)
+
+        assert gotten_response.status_code == http.HTTPStatus.OK
+        assert gotten_response.headers["content-type"] == "application/json"
+        assert gotten_response.json() == {
+            "messages": {"info": [], "warning": [], "error": []}
+        }
@@ -13,6 +13,7 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 import json
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import patch
 
@@ -21,12 +22,22 @@ from fastapi.testclient import TestClient
 
 from tests.helpers.fakes import get_fake_account
 from tjf.api.models import QuotaResponse, ResponseMessages
+from tjf.runtimes.k8s import runtime as k8s_runtime
+from tjf.settings import Settings
+
+
+@pytest.fixture(autouse=True)
+def empty_quotas_cache(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(k8s_runtime, "QUOTAS_CACHE", {})
 
 
 @pytest.fixture
 def account_with_quotas(fixtures_path: Path):
     class FakeK8sCli:
+        calls = 0
+
         def get_object(self, kind, name):
+            self.calls += 1
             if kind == "limitranges" and name == "tool-some-tool":
                 return json.loads(
                     (fixtures_path / "quotas" / "limitrange.json").read_text()
@@ -68,3 +79,45 @@ def test_quota_endpoint(
 
     assert response.status_code == 200
     assert response.json() == expected
+
+
+def test_quota_endpoint_reuses_recently_loaded_quotas(
+    client: TestClient,
+    patch_account_to_have_quotas,
+    fake_auth_headers: dict[str, str],
+):
+    first_response = client.get("/v1/tool/some-tool/quotas", headers=fake_auth_headers)
+    second_response = client.get("/v1/tool/some-tool/quotas", headers=fake_auth_headers)
+
+    assert first_response.status_code == 200
+    assert second_response.json() == first_response.json()
+    # one call for the resource quota and one for the limit range
+    assert patch_account_to_have_quotas.k8s_cli.calls == 2
+
+
+def test_quota_endpoint_drops_expired_cache_entries(
+    client: TestClient,
+    patch_account_to_have_quotas,
+    fake_auth_headers: dict[str, str],
+):
+    k8s_runtime.QUOTAS_CACHE["expired-tool"] = k8s_runtime.QuotaCacheEntry(
+        creation_time=datetime.now(tz=timezone.utc) - timedelta(days=1), quotas=[]
+    )
+
+    response = client.get("/v1/tool/some-tool/quotas", headers=fake_auth_headers)
+
+    assert response.status_code == 200
+    assert "expired-tool" not in k8s_runtime.QUOTAS_CACHE
+    assert "some-tool" in k8s_runtime.QUOTAS_CACHE
+
+
+def test_get_quotas_does_not_cache_with_a_zero_ttl(patch_account_to_have_quotas):
+    my_runtime = k8s_runtime.K8sRuntime(
+        settings=Settings(quotas_cache_ttl=timedelta(seconds=0))
+    )
+
+    my_runtime.get_quotas(tool_name="some-tool")
+    my_runtime.get_quotas(tool_name="some-tool")
+
+    # one call for the resource quota and one for the limit range, each time
+    assert patch_account_to_have_quotas.k8s_cli.calls == 4
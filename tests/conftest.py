@@ -17,7 +17,7 @@ import tjf.core.images
 import tjf.settings
 from tjf.api.app import JobsApi, create_app
 from tjf.api.auth import TOOL_HEADER
-from tjf.core.images import HarborConfig, _get_images_data
+from tjf.core.images import HarborConfig
 from tjf.runtimes.k8s import jobs
 from tjf.runtimes.k8s.account import ToolAccount
 from tjf.settings import Settings
@@ -39,6 +39,12 @@ def clean_settings_environment(monkeypatch: pytest.MonkeyPatch):
     tjf.settings.settings = None
 
 
+@pytest.fixture(autouse=True)
+def clean_harbor_responses_cache():
+    # don't let the etags of one test be used for revalidation in the next ones
+    tjf.core.images.HARBOR_RESPONSES_CACHE.clear()
+
+
 @pytest.fixture
 def fixtures_path() -> Generator[Path, None, None]:
     yield FIXTURES_PATH
@@ -155,7 +161,9 @@ def fake_images(
     fake_harbor_content: dict[str, Any],
     patch_kube_config_loading: None,
 ) -> dict[str, Any]:
-    _get_images_data.cache_clear()
+    # a refresh started by a previous test would otherwise overwrite the reset below
+    tjf.core.images._wait_for_images_data_refresh()
+    tjf.core.images.IMAGES_DATA = None
 
     def fake_init(*args, **kwargs):
         pass
@@ -1,10 +1,28 @@
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from requests.cookies import create_cookie
+from requests_mock import Mocker
+
+import tjf.core.images
+import tjf.settings
 from tests.helpers.fakes import FAKE_HARBOR_HOST
 from tests.utils import cases
 from tjf.core.images import (
+    HARBOR_IMAGES_CACHE,
+    HARBOR_RESPONSES_CACHE,
+    CacheEntry,
     Image,
     ImageType,
+    _get_harbor_images,
+    _get_harbor_session,
+    _parse_prebuilt_images,
     get_images,
 )
+from tjf.settings import Settings
 
 
 def test_available_images_len(fake_images):
@@ -502,3 +520,358 @@ def test_from_short_name_or_url_non_existing_image_without_raising(
     assert gotten_image.model_dump(exclude_unset=True) == expected_image.model_dump(
         exclude_unset=True
     )
+
+
+def test_get_harbor_images_fetches_every_repository(
+    fake_harbor_config, requests_mock: Mocker
+):
+    repository_names = ["first", "second", "third"]
+    requests_mock.get(
+        f"https://{FAKE_HARBOR_HOST}/api/v2.0/projects/tool-many-repos/repositories",
+        json=[{"name": f"tool-many-repos/{name}"} for name in repository_names],
+    )
+    for name in repository_names:
+        requests_mock.get(
+            f"https://{FAKE_HARBOR_HOST}/api/v2.0/projects/tool-many-repos/repositories/{name}/artifacts",
+            json=[
+                {
+                    "type": "IMAGE",
+                    "digest": f"sha256:{name}",
+                    "tags": [{"name": "latest"}],
+                }
+            ],
+        )
+
+    gotten_images = _get_harbor_images(tool_name="many-repos", use_harbor_cache=False)
+
+    # the order of the repositories is kept even if fetched concurrently
+    assert [image.short_name for image in gotten_images] == [
+        f"tool-many-repos/{name}:latest" for name in repository_names
+    ]
+
+
+def test_from_short_name_or_url_matches_the_right_repository(
+    fake_harbor_config, fake_images, requests_mock: Mocker
+):
+    repository_names = ["first", "second", "third"]
+    requests_mock.get(
+        f"https://{FAKE_HARBOR_HOST}/api/v2.0/projects/tool-many-repos/repositories",
+        json=[{"name": f"tool-many-repos/{name}"} for name in repository_names],
+    )
+    for name in repository_names:
+        requests_mock.get(
+            f"https://{FAKE_HARBOR_HOST}/api/v2.0/projects/tool-many-repos/repositories/{name}/artifacts",
+            json=[
+                {
+                    "type": "IMAGE",
+                    "digest": f"sha256:{name}",
+                    "tags": [{"name": "latest"}, {"name": "v1"}],
+                }
+            ],
+        )
+
+    gotten_image = Image.from_short_name_or_url(
+        url_or_name="tool-many-repos/second:v1",
+        tool_name="many-repos",
+        use_harbor_cache=False,
+    )
+
+    assert gotten_image.exists
+    assert gotten_image.path == "tool-many-repos/second"
+    assert gotten_image.tag == "v1"
+    assert gotten_image.aliases == ["tool-many-repos/second:v1@sha256:second"]
+
+
+def test_from_short_name_or_url_does_not_change_the_cached_images(fake_images):
+    digest = "sha256:5b8c5641d2dbd7d849cacb39853141c00b29ed9f40af9ee946b6a6a715e637c3"
+    with_digest = Image.from_short_name_or_url(
+        url_or_name=f"tool-some-tool/some-container:latest@{digest}",
+        tool_name="some-tool",
+    )
+    without_digest = Image.from_short_name_or_url(
+        url_or_name="tool-some-tool/some-container:latest",
+        tool_name="some-tool",
+    )
+
+    assert with_digest.short_name == f"tool-some-tool/some-container:latest@{digest}"
+    assert without_digest.short_name == "tool-some-tool/some-container:latest"
+    assert "digest" not in without_digest.model_fields_set
+    cached_image = next(
+        image
+        for image in get_images(tool_name="some-tool")
+        if image.short_name == "tool-some-tool/some-container:latest"
+    )
+    assert cached_image.digest == digest
+
+
+def test_from_short_name_or_url_without_cache_fetches_only_the_repository(
+    fake_harbor_config, fake_images, requests_mock: Mocker
+):
+    repositories_mock = requests_mock.get(
+        f"https://{FAKE_HARBOR_HOST}/api/v2.0/projects/tool-one-repo/repositories",
+        json=[{"name": "tool-one-repo/wanted"}, {"name": "tool-one-repo/other"}],
+    )
+    other_artifacts_mock = requests_mock.get(
+        f"https://{FAKE_HARBOR_HOST}/api/v2.0/projects/tool-one-repo/repositories/other/artifacts",
+        json=[],
+    )
+    requests_mock.get(
+        f"https://{FAKE_HARBOR_HOST}/api/v2.0/projects/tool-one-repo/repositories/wanted/artifacts",
+        json=[
+            {"type": "IMAGE", "digest": "sha256:wanted", "tags": [{"name": "latest"}]}
+        ],
+    )
+
+    gotten_image = Image.from_short_name_or_url(
+        url_or_name="tool-one-repo/wanted:latest",
+        tool_name="one-repo",
+        use_harbor_cache=False,
+    )
+
+    assert gotten_image.exists
+    assert gotten_image.path == "tool-one-repo/wanted"
+    assert not repositories_mock.called
+    assert not other_artifacts_mock.called
+
+
+def test_from_short_name_or_url_with_cache_fills_the_project_cache(
+    fake_harbor_config, fake_images, requests_mock: Mocker
+):
+    repositories_mock = requests_mock.get(
+        f"https://{FAKE_HARBOR_HOST}/api/v2.0/projects/tool-cached-repo/repositories",
+        json=[{"name": "tool-cached-repo/img"}],
+    )
+    artifacts_mock = requests_mock.get(
+        f"https://{FAKE_HARBOR_HOST}/api/v2.0/projects/tool-cached-repo/repositories/img/artifacts",
+        json=[{"type": "IMAGE", "digest": "sha256:img", "tags": [{"name": "latest"}]}],
+    )
+
+    # like loading the jobs of a tool, one lookup per job
+    gotten_images = [
+        Image.from_short_name_or_url(
+            url_or_name="tool-cached-repo/img:latest", tool_name="cached-repo"
+        )
+        for _ in range(20)
+    ]
+
+    assert all(image.exists for image in gotten_images)
+    assert repositories_mock.call_count == 1
+    assert artifacts_mock.call_count == 1
+
+
+def test_from_short_name_or_url_unknown_repository(
+    fake_harbor_config, fake_images, requests_mock: Mocker
+):
+    requests_mock.get(
+        f"https://{FAKE_HARBOR_HOST}/api/v2.0/projects/tool-one-repo/repositories/missing/artifacts",
+        status_code=404,
+    )
+
+    gotten_image = Image.from_short_name_or_url(
+        url_or_name="tool-one-repo/missing:latest",
+        tool_name="one-repo",
+        use_harbor_cache=False,
+    )
+
+    assert not gotten_image.exists
+    assert gotten_image.path == "tool-one-repo/missing"
+
+
+def test_get_harbor_images_revalidates_with_etag(
+    fake_harbor_config, requests_mock: Mocker
+):
+    requests_mock.get(
+        f"https://{FAKE_HARBOR_HOST}/api/v2.0/projects/tool-etag/repositories",
+        json=[{"name": "tool-etag/cached"}],
+    )
+    artifacts_url = f"https://{FAKE_HARBOR_HOST}/api/v2.0/projects/tool-etag/repositories/cached/artifacts"
+    requests_mock.get(
+        artifacts_url,
+        json=[
+            {"type": "IMAGE", "digest": "sha256:cached", "tags": [{"name": "latest"}]}
+        ],
+        headers={"ETag": '"some-etag"'},
+    )
+    first_images = _get_harbor_images(tool_name="etag", use_harbor_cache=False)
+
+    artifacts_mock = requests_mock.get(artifacts_url, status_code=304)
+    second_images = _get_harbor_images(tool_name="etag", use_harbor_cache=False)
+
+    assert artifacts_mock.last_request.headers["If-None-Match"] == '"some-etag"'
+    assert second_images == first_images
+
+
+def test_get_harbor_images_keeps_only_the_most_recent_responses(
+    fake_harbor_config, requests_mock: Mocker, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(tjf.core.images, "HARBOR_RESPONSES_CACHE_MAX_SIZE", 2)
+    for tool_name in ["first", "second", "first", "third"]:
+        requests_mock.get(
+            f"https://{FAKE_HARBOR_HOST}/api/v2.0/projects/tool-{tool_name}/repositories",
+            json=[],
+            headers={"ETag": f'"{tool_name}"'},
+        )
+        _get_harbor_images(tool_name=tool_name, use_harbor_cache=False)
+
+    # "second" is the least recently used one
+    assert [entry.etag for entry in HARBOR_RESPONSES_CACHE.values()] == [
+        '"first"',
+        '"third"',
+    ]
+
+
+def test_get_harbor_images_drops_expired_cache_entries(
+    fake_harbor_config, requests_mock: Mocker
+):
+    HARBOR_IMAGES_CACHE["expired-tool"] = CacheEntry(
+        images=[], creation_time=datetime.now(tz=UTC) - timedelta(days=1)
+    )
+    requests_mock.get(
+        f"https://{FAKE_HARBOR_HOST}/api/v2.0/projects/tool-fresh-tool/repositories",
+        json=[],
+    )
+
+    _get_harbor_images(tool_name="fresh-tool", use_harbor_cache=True)
+
+    assert "expired-tool" not in HARBOR_IMAGES_CACHE
+    assert "fresh-tool" in HARBOR_IMAGES_CACHE
+
+
+def test_get_images_builds_the_prebuilt_images_once_per_refresh(
+    fake_images, monkeypatch: pytest.MonkeyPatch
+):
+    # make sure the images data is not refreshed between the calls
+    monkeypatch.setattr(
+        tjf.settings,
+        "settings",
+        Settings(images_config_refresh_interval=timedelta(hours=1)),
+    )
+    first_images = get_images(tool_name="some-tool")
+    second_images = get_images(tool_name="some-tool")
+
+    assert first_images == second_images
+    assert first_images is not second_images
+    assert all(
+        first_image is second_image
+        for first_image, second_image in zip(first_images, second_images)
+        if first_image.type == ImageType.STANDARD
+    )
+
+
+def test_get_harbor_images_skips_empty_repositories(
+    fake_harbor_config, requests_mock: Mocker
+):
+    requests_mock.get(
+        f"https://{FAKE_HARBOR_HOST}/api/v2.0/projects/tool-empty-repo/repositories",
+        json=[
+            {"name": "tool-empty-repo/empty", "artifact_count": 0},
+            {"name": "tool-empty-repo/full", "artifact_count": 1},
+        ],
+    )
+    empty_artifacts_mock = requests_mock.get(
+        f"https://{FAKE_HARBOR_HOST}/api/v2.0/projects/tool-empty-repo/repositories/empty/artifacts",
+        json=[],
+    )
+    requests_mock.get(
+        f"https://{FAKE_HARBOR_HOST}/api/v2.0/projects/tool-empty-repo/repositories/full/artifacts",
+        json=[{"type": "IMAGE", "digest": "sha256:full", "tags": [{"name": "latest"}]}],
+    )
+
+    gotten_images = _get_harbor_images(tool_name="empty-repo", use_harbor_cache=False)
+
+    assert [image.path for image in gotten_images] == ["tool-empty-repo/full"]
+    assert not empty_artifacts_mock.called
+
+
+def test_get_harbor_images_sends_the_user_agent(
+    fake_harbor_config, requests_mock: Mocker
+):
+    repositories_mock = requests_mock.get(
+        f"https://{FAKE_HARBOR_HOST}/api/v2.0/projects/tool-user-agent/repositories",
+        json=[],
+    )
+
+    _get_harbor_images(tool_name="user-agent", use_harbor_cache=False)
+
+    assert repositories_mock.last_request.headers["User-Agent"].startswith(
+        "jobs-framework-api python-requests/"
+    )
+
+
+def test_harbor_session_does_not_keep_cookies():
+    cookie = create_cookie(name="sid", value="secret", domain=FAKE_HARBOR_HOST)
+    request = urllib.request.Request(f"https://{FAKE_HARBOR_HOST}/api/v2.0/projects")
+
+    cookies = _get_harbor_session().cookies
+    cookies.set_cookie_if_ok(cookie, request)
+
+    assert not cookies
+
+
+def test_get_harbor_images_fetches_once_for_concurrent_requests(
+    fake_harbor_config, requests_mock: Mocker
+):
+    def slow_repositories(request, context):
+        time.sleep(0.1)
+        return []
+
+    repositories_mock = requests_mock.get(
+        f"https://{FAKE_HARBOR_HOST}/api/v2.0/projects/tool-concurrent/repositories",
+        json=slow_repositories,
+    )
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(
+                _get_harbor_images, tool_name="concurrent", use_harbor_cache=True
+            )
+            for _ in range(4)
+        ]
+
+    assert [future.result() for future in futures] == [[]] * 4
+    assert repositories_mock.call_count == 1
+
+
+def test_get_images_refreshes_stale_images_data_in_the_background(
+    fake_images, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(
+        tjf.settings,
+        "settings",
+        Settings(images_config_refresh_interval=timedelta(hours=0)),
+    )
+    first_images = get_images(tool_name="some-tool")
+    stale_images_data = tjf.core.images.IMAGES_DATA
+
+    # the stale data is still used, while it's being refreshed
+    assert get_images(tool_name="some-tool") == first_images
+    tjf.core.images._wait_for_images_data_refresh()
+
+    assert tjf.core.images.IMAGES_DATA is not stale_images_data
+    assert tjf.core.images.IMAGES_DATA.images == stale_images_data.images
+
+
+@pytest.mark.parametrize(
+    "container, expected_tag, expected_digest",
+    [
+        ["registry.example.org/some-image", "latest", ""],
+        ["registry.example.org/some-image:v1", "v1", ""],
+        ["registry.example.org/some-image:v1@sha256:abcd", "v1", "sha256:abcd"],
+        ["registry.example.org/some-image@sha256:abcd", "latest", "sha256:abcd"],
+    ],
+)
+def test_parse_prebuilt_images_splits_the_container(
+    container: str, expected_tag: str, expected_digest: str
+):
+    (gotten_image,) = _parse_prebuilt_images(
+        data={
+            "some-image": {"image": container, "state": "stable"},
+            "no-image": {"state": "stable"},
+            "empty": None,
+        }
+    )
+
+    assert gotten_image.host == "registry.example.org"
+    assert gotten_image.path == "some-image"
+    assert gotten_image.tag == expected_tag
+    assert gotten_image.digest == expected_digest
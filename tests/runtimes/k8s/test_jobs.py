@@ -1,8 +1,10 @@
 from copy import deepcopy
+from datetime import datetime, timezone
 from pathlib import Path, PosixPath
 from typing import Any, Callable
 
 from pytest import MonkeyPatch
+from toolforge_weld.logs import LogEntry
 
 from tests.helpers.fake_k8s import (
     K8S_CONTINUOUS_JOB_OBJ,
@@ -600,3 +602,17 @@ class TestGetJobForK8s:
             gotten_k8s_obj = jobs.get_job_for_k8s(job=my_job, default_cpu_limit="1000m")
 
             assert match(gotten_k8s_obj)
+
+
+def test_format_logs_drops_subsecond_precision():
+    entry = LogEntry(
+        pod="contjob-5c858fb978-tv2zb",
+        container="job",
+        datetime=datetime(2025, 7, 7, 12, 34, 51, 123456, tzinfo=timezone.utc),
+        message="another loop!",
+    )
+
+    assert jobs.format_logs(entry) == (
+        '{"pod": "contjob-5c858fb978-tv2zb", "container": "job", '
+        '"datetime": "2025-07-07T12:34:51+00:00", "message": "another loop!"}\n'
+    )
@@ -725,6 +725,38 @@ class TestGetScheduledJob:
             exclude=["k8s_object"]
         )
 
+    def test_get_scheduled_jobs_only_gets_the_status_of_the_given_jobs(
+        self,
+        fake_images: dict[str, Any],
+        monkeymodule: pytest.MonkeyPatch,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        other_k8s_object = deepcopy(K8S_SCHEDULED_JOB_OBJ)
+        other_k8s_object["metadata"]["name"] = "other"
+        other_k8s_object["metadata"]["labels"]["app.kubernetes.io/name"] = "other"
+        patch_tool_account_k8s_cli(
+            monkeymodule=monkeymodule,
+            get_objects_mock=lambda *args, kind, **kwargs: (
+                [deepcopy(K8S_SCHEDULED_JOB_OBJ), other_k8s_object]
+                if kind == "cronjobs"
+                else []
+            ),
+        )
+        my_runtime = K8sRuntime(settings=get_settings(default_cpu_limit="1000m"))
+        mock_get_scheduled_job_status = MagicMock(return_value=ScheduledJobStatus())
+        monkeypatch.setattr(
+            k8s_runtime, "get_scheduled_job_status", mock_get_scheduled_job_status
+        )
+
+        gotten_jobs = my_runtime.get_scheduled_jobs(
+            tool_name="tf-test", job_names={K8S_SCHEDULED_JOB_OBJ["metadata"]["name"]}
+        )
+
+        assert [job.job_name for job in gotten_jobs] == [
+            K8S_SCHEDULED_JOB_OBJ["metadata"]["name"]
+        ]
+        mock_get_scheduled_job_status.assert_called_once()
+
 
 class TestGetContinuousJob:
     def test_raises_when_no_job_found(self, monkeymodule: pytest.MonkeyPatch):
@@ -1058,6 +1090,38 @@ class TestGetContinuousJob:
             exclude=["k8s_object"]
         )
 
+    def test_get_continuous_jobs_only_gets_the_status_of_the_given_jobs(
+        self,
+        fake_images: dict[str, Any],
+        monkeymodule: pytest.MonkeyPatch,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        other_k8s_object = deepcopy(K8S_CONTINUOUS_JOB_OBJ)
+        other_k8s_object["metadata"]["name"] = "other"
+        other_k8s_object["metadata"]["labels"]["app.kubernetes.io/name"] = "other"
+        patch_tool_account_k8s_cli(
+            monkeymodule=monkeymodule,
+            get_objects_mock=lambda *args, kind, **kwargs: (
+                [deepcopy(K8S_CONTINUOUS_JOB_OBJ), other_k8s_object]
+                if kind == "deployments"
+                else []
+            ),
+        )
+        my_runtime = K8sRuntime(settings=get_settings(default_cpu_limit="1000m"))
+        mock_get_continuous_job_status = MagicMock(return_value=ContinuousJobStatus())
+        monkeypatch.setattr(
+            k8s_runtime, "get_continuous_job_status", mock_get_continuous_job_status
+        )
+
+        gotten_jobs = my_runtime.get_continuous_jobs(
+            tool_name="tf-test", job_names={K8S_CONTINUOUS_JOB_OBJ["metadata"]["name"]}
+        )
+
+        assert [job.job_name for job in gotten_jobs] == [
+            K8S_CONTINUOUS_JOB_OBJ["metadata"]["name"]
+        ]
+        mock_get_continuous_job_status.assert_called_once()
+
 
 class TestDeleteJobs:
     @staticmethod
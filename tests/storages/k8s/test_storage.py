@@ -12,7 +12,11 @@ from tjf.core.models import (
     ScheduledJob,
 )
 from tjf.settings import Settings
-from tjf.storages.exceptions import AlreadyExistsInStorage, NotFoundInStorage
+from tjf.storages.exceptions import (
+    AlreadyExistsInStorage,
+    NotFoundInStorage,
+    StorageError,
+)
 from tjf.storages.k8s import storage
 
 
@@ -296,7 +300,13 @@ class TestStorage:
             gotten_job = my_storage.get_job(tool_name="tf-test", job_name="testcont2")
 
             assert gotten_job == expected_job
-            assert_jobs_get_k8s_calls(storage_k8s_cli=storage_k8s_cli)
+            # no need to list the scheduled jobs once found
+            storage_k8s_cli.list_namespaced_custom_object.assert_called_once_with(
+                version="v1",
+                group="jobs-api.toolforge.org",
+                namespace="tool-tf-test",
+                plural="continuous-jobs",
+            )
 
     class TestCreateJob:
         def test_creates_continuous_job_with_only_set_values(
@@ -401,6 +411,72 @@ class TestStorage:
 
             storage_k8s_cli.create_namespaced_custom_object.assert_called_once()
 
+    class TestUpdateJob:
+        def test_replaces_the_job_at_its_current_resource_version(
+            self, storage_k8s_cli: MagicMock
+        ):
+            my_storage = storage.K8sStorage(settings=Settings(debug=True))
+            expected_job = get_scheduled_job(name="testsched2")
+            storage_k8s_cli.get_namespaced_custom_object.return_value = {
+                "metadata": {"name": "testsched2", "resourceVersion": "1234"}
+            }
+
+            gotten_job = my_storage.update_job(job=expected_job)
+
+            assert gotten_job == expected_job
+            storage_k8s_cli.get_namespaced_custom_object.assert_called_once_with(
+                group="jobs-api.toolforge.org",
+                version="v1",
+                plural="scheduled-jobs",
+                namespace="tool-tf-test",
+                name="testsched2",
+            )
+            storage_k8s_cli.replace_namespaced_custom_object.assert_called_once()
+            sent_body = (
+                storage_k8s_cli.replace_namespaced_custom_object.call_args.kwargs[
+                    "body"
+                ]
+            )
+            assert sent_body["metadata"] == {
+                "name": "testsched2",
+                "resourceVersion": "1234",
+            }
+            assert (
+                sent_body["spec"] == storage._job_to_k8s_crd(job=expected_job)["spec"]
+            )
+            storage_k8s_cli.delete_namespaced_custom_object.assert_not_called()
+            storage_k8s_cli.create_namespaced_custom_object.assert_not_called()
+
+        def test_bubbles_up_not_found_as_NotFoundInStorage(
+            self, storage_k8s_cli: MagicMock
+        ):
+            my_storage = storage.K8sStorage(settings=Settings(debug=True))
+            storage_k8s_cli.get_namespaced_custom_object.side_effect = (
+                kubernetes.client.ApiException(status=status.HTTP_404_NOT_FOUND)
+            )
+
+            with pytest.raises(NotFoundInStorage):
+                my_storage.update_job(job=get_continuous_job())
+
+            storage_k8s_cli.replace_namespaced_custom_object.assert_not_called()
+
+        def test_raises_conflict_if_the_job_changed_meanwhile(
+            self, storage_k8s_cli: MagicMock
+        ):
+            my_storage = storage.K8sStorage(settings=Settings(debug=True))
+            storage_k8s_cli.get_namespaced_custom_object.return_value = {
+                "metadata": {"name": "testcont", "resourceVersion": "1234"}
+            }
+            storage_k8s_cli.replace_namespaced_custom_object.side_effect = (
+                kubernetes.client.ApiException(status=status.HTTP_409_CONFLICT)
+            )
+
+            with pytest.raises(StorageError) as error:
+                my_storage.update_job(job=get_continuous_job())
+
+            assert not isinstance(error.value, AlreadyExistsInStorage)
+            assert error.value.http_status_code == status.HTTP_409_CONFLICT
+
     class TestDeleteJob:
         def test_returns_deleted_job_if_found(self, storage_k8s_cli: MagicMock):
             my_storage = storage.K8sStorage(settings=Settings(debug=True))
@@ -11,6 +11,7 @@ from tjf.core.error import TjfValidationError
 from tjf.core.images import Image, ImageType
 from tjf.core.models import (
     OUT_OF_SYNC_JOB_WARNING_MESSAGE,
+    AnyJob,
     AnyJobStatus,
     ContinuousJobStatus,
     JobType,
@@ -269,6 +270,20 @@ class TestCore:
             assert gotten_job.status.up_to_date
             assert my_runtime_job.status.short == gotten_job.status.short
 
+        def test_runtime_job_of_different_type_sets_up_to_date_false(self):
+            my_storage_job = get_dummy_job(
+                job_name="my-job", job_type=JobType.CONTINUOUS
+            )
+            my_runtime_job = get_dummy_job(
+                job_name="my-job", job_type=JobType.SCHEDULED
+            )
+            gotten_job = core._update_storage_job_status_from_runtime(
+                storage_job=my_storage_job, runtime_job=my_runtime_job
+            )
+
+            assert not gotten_job.status.up_to_date
+            assert "is different" in gotten_job.status_long
+
         def test_runtime_job_with_non_existing_image_matches_same_storage_job(
             self,
         ):
@@ -568,6 +583,31 @@ class TestCore:
                 job=updated_job.get_resolved_core_job()
             )
 
+        def test_replaces_changed_job_in_storage(
+            self,
+            get_my_core: GetMyCore,
+            monkeypatch: pytest.MonkeyPatch,
+        ):
+            existing_job = get_dummy_job(job_name="my-job", job_type=JobType.SCHEDULED)
+            updated_job = get_dummy_job(
+                job_name="my-job",
+                job_type=JobType.SCHEDULED,
+                cmd="different command",
+            )
+            my_core = get_my_core()
+            mock_storage_update_job = MagicMock(spec=my_core.storage.update_job)
+            mock_storage_delete_job = MagicMock(spec=my_core.storage.delete_job)
+            monkeypatch.setattr(my_core.storage, "update_job", mock_storage_update_job)
+            monkeypatch.setattr(my_core.storage, "delete_job", mock_storage_delete_job)
+
+            changed = my_core._update_job_in_storage(
+                existing_job=existing_job, new_job=updated_job
+            )
+
+            assert changed is True
+            mock_storage_update_job.assert_called_once_with(job=updated_job)
+            mock_storage_delete_job.assert_not_called()
+
     class TestRestartJob:
         def test_creates_continuous_job_in_runtime_if_it_does_not_exist(
             self,
@@ -752,13 +792,24 @@ class TestCore:
                 spec=my_core.runtime.get_one_off_jobs,
                 return_value=[],
             )
+            mock_runtime_get_continuous_jobs = MagicMock(
+                spec=my_core.runtime.get_continuous_jobs,
+                side_effect=Exception("Unexpected error!"),
+            )
             mock_runtime_get_continuous_job = MagicMock(
                 spec=my_core.runtime.get_continuous_job,
                 side_effect=Exception("Unexpected error!"),
             )
             monkeypatch.setattr(my_core.storage, "get_jobs", mock_storage_get_jobs)
             monkeypatch.setattr(
-                my_core.runtime, "get_continuous_job", mock_runtime_get_continuous_job
+                my_core.runtime,
+                "get_continuous_jobs",
+                mock_runtime_get_continuous_jobs,
+            )
+            monkeypatch.setattr(
+                my_core.runtime,
+                "get_continuous_job",
+                mock_runtime_get_continuous_job,
             )
             monkeypatch.setattr(
                 my_core.runtime, "get_one_off_jobs", mock_runtime_get_one_off_jobs
@@ -766,14 +817,172 @@ class TestCore:
 
             gotten_jobs = my_core.get_jobs(tool_name="some-tool")
 
-            assert len(gotten_jobs) == 1
-            assert gotten_jobs[0].job_name == storage_job.job_name
-            assert gotten_jobs[0].status.up_to_date is False
-            assert gotten_jobs[0].status_long == OUT_OF_SYNC_JOB_WARNING_MESSAGE.format(
+            (gotten_job,) = gotten_jobs
+            assert gotten_job.job_name == storage_job.job_name
+            assert gotten_job.status.up_to_date is False
+            assert gotten_job.status_long == OUT_OF_SYNC_JOB_WARNING_MESSAGE.format(
                 job_name=storage_job.job_name
             )
             mock_storage_get_jobs.assert_called_once_with(tool_name="some-tool")
+            mock_runtime_get_continuous_jobs.assert_called_once_with(
+                tool_name="some-tool", job_names={"my-job"}
+            )
             mock_runtime_get_continuous_job.assert_called_once_with(
                 job_name="my-job", tool_name="some-tool"
             )
             storage_k8s_cli.create_namespaced_custom_object.assert_not_called()
+
+        def test_lists_each_runtime_job_type_only_once(
+            self,
+            get_my_core: GetMyCore,
+            monkeypatch: pytest.MonkeyPatch,
+        ):
+            storage_jobs = [
+                get_dummy_job(job_name="continuous-1", job_type=JobType.CONTINUOUS),
+                get_dummy_job(job_name="continuous-2", job_type=JobType.CONTINUOUS),
+                get_dummy_job(job_name="scheduled-1", job_type=JobType.SCHEDULED),
+            ]
+            my_core = get_my_core()
+            mock_runtime_get_continuous_jobs = MagicMock(
+                spec=my_core.runtime.get_continuous_jobs,
+                return_value=[storage_jobs[0], storage_jobs[1]],
+            )
+            mock_runtime_get_scheduled_jobs = MagicMock(
+                spec=my_core.runtime.get_scheduled_jobs,
+                return_value=[storage_jobs[2]],
+            )
+            mock_runtime_get_continuous_job = MagicMock(
+                spec=my_core.runtime.get_continuous_job
+            )
+            monkeypatch.setattr(
+                my_core.storage, "get_jobs", lambda *args, **kwargs: storage_jobs
+            )
+            monkeypatch.setattr(
+                my_core.runtime, "get_one_off_jobs", lambda *args, **kwargs: []
+            )
+            monkeypatch.setattr(
+                my_core.runtime,
+                "get_continuous_jobs",
+                mock_runtime_get_continuous_jobs,
+            )
+            monkeypatch.setattr(
+                my_core.runtime,
+                "get_scheduled_jobs",
+                mock_runtime_get_scheduled_jobs,
+            )
+            monkeypatch.setattr(
+                my_core.runtime,
+                "get_continuous_job",
+                mock_runtime_get_continuous_job,
+            )
+
+            gotten_jobs = my_core.get_jobs(tool_name="some-tool")
+
+            assert [job.job_name for job in gotten_jobs] == [
+                "continuous-1",
+                "continuous-2",
+                "scheduled-1",
+            ]
+            mock_runtime_get_continuous_jobs.assert_called_once_with(
+                tool_name="some-tool", job_names={"continuous-1", "continuous-2"}
+            )
+            mock_runtime_get_scheduled_jobs.assert_called_once_with(
+                tool_name="some-tool", job_names={"scheduled-1"}
+            )
+            mock_runtime_get_continuous_job.assert_not_called()
+
+        def test_only_marks_the_failing_job_out_of_sync_when_listing_fails(
+            self,
+            get_my_core: GetMyCore,
+            monkeypatch: pytest.MonkeyPatch,
+        ):
+            broken_job = get_dummy_job(
+                job_name="broken-job", job_type=JobType.CONTINUOUS
+            )
+            working_job = get_dummy_job(
+                job_name="working-job", job_type=JobType.CONTINUOUS
+            )
+
+            def get_continuous_job(*, job_name: str, tool_name: str) -> AnyJob:
+                if job_name == broken_job.job_name:
+                    raise Exception("Unexpected error!")
+                return working_job
+
+            my_core = get_my_core()
+            monkeypatch.setattr(
+                my_core.storage,
+                "get_jobs",
+                lambda *args, **kwargs: [broken_job, working_job],
+            )
+            monkeypatch.setattr(
+                my_core.runtime, "get_one_off_jobs", lambda *args, **kwargs: []
+            )
+            monkeypatch.setattr(
+                my_core.runtime,
+                "get_continuous_jobs",
+                MagicMock(
+                    spec=my_core.runtime.get_continuous_jobs,
+                    side_effect=Exception("Unexpected error!"),
+                ),
+            )
+            monkeypatch.setattr(
+                my_core.runtime, "get_continuous_job", get_continuous_job
+            )
+
+            gotten_jobs = {
+                job.job_name: job for job in my_core.get_jobs(tool_name="some-tool")
+            }
+
+            assert gotten_jobs[broken_job.job_name].status.up_to_date is False
+            assert gotten_jobs[working_job.job_name].status.up_to_date is True
+
+    class TestGetLogs:
+        @pytest.mark.asyncio
+        @pytest.mark.parametrize("lines", ["", "ten", "1.5", "--5", "²"])
+        async def test_raises_on_invalid_lines(
+            self, get_my_core: GetMyCore, lines: str
+        ):
+            my_core = get_my_core()
+
+            with pytest.raises(
+                TjfValidationError, match="Unable to parse lines as integer"
+            ):
+                await my_core.get_logs(
+                    tool_name="some-tool",
+                    job_name="my-job",
+                    request_args={"lines": lines},
+                )
+
+        @pytest.mark.asyncio
+        @pytest.mark.parametrize(
+            "lines, expected_lines", [("10", 10), ("+5", 5), (" 5", 5)]
+        )
+        async def test_passes_lines_and_follow_to_the_runtime(
+            self,
+            get_my_core: GetMyCore,
+            monkeypatch: pytest.MonkeyPatch,
+            lines: str,
+            expected_lines: int,
+        ):
+            async def fake_logs():
+                yield "some log line\n"
+
+            my_core = get_my_core()
+            mock_runtime_get_logs = MagicMock(
+                spec=my_core.runtime.get_logs, return_value=fake_logs()
+            )
+            monkeypatch.setattr(my_core.runtime, "get_logs", mock_runtime_get_logs)
+
+            logs = await my_core.get_logs(
+                tool_name="some-tool",
+                job_name="my-job",
+                request_args={"lines": lines, "follow": "true"},
+            )
+
+            assert [line async for line in logs] == ["some log line\n"]
+            mock_runtime_get_logs.assert_called_once_with(
+                tool_name="some-tool",
+                job_name="my-job",
+                follow=True,
+                lines=expected_lines,
+            )
@@ -1,6 +1,6 @@
 import pytest
 
-from tjf.core.cron import CronExpression, CronParsingError
+from tjf.core.cron import CronExpression, CronParsingError, _parse_parts
 
 JOB_NAME = "some-job"
 TOOL_NAME = "some-tool"
@@ -107,3 +107,44 @@ def test_cron_parse_invalid_at_macro():
             )
             is None
         )
+
+
+def test_cron_parse_same_value_validated_per_field():
+    assert (
+        str(
+            CronExpression.parse(
+                value="1 13 3 4 5", job_name=JOB_NAME, tool_name=TOOL_NAME
+            )
+        )
+        == "1 13 3 4 5"
+    )
+
+    with pytest.raises(CronParsingError, match="Invalid value '13', expected 1-12"):
+        CronExpression.parse(value="1 2 3 13 5", job_name=JOB_NAME, tool_name=TOOL_NAME)
+
+    # invalid values are not cached, they fail every time
+    with pytest.raises(CronParsingError, match="Invalid value '13', expected 1-12"):
+        CronExpression.parse(value="1 2 3 13 5", job_name=JOB_NAME, tool_name=TOOL_NAME)
+
+
+def test_cron_parse_at_macro_returns_independent_expressions_per_job():
+    first = CronExpression.parse(value="@daily", job_name=JOB_NAME, tool_name=TOOL_NAME)
+    second = CronExpression.parse(
+        value="@daily", job_name=JOB_NAME, tool_name=TOOL_NAME
+    )
+    other_job = CronExpression.parse(
+        value="@daily", job_name="some-other-job", tool_name=TOOL_NAME
+    )
+
+    assert first == second
+    assert first is not second
+    assert str(other_job) != str(first)
+
+
+def test_cron_parse_shares_the_cached_parts_between_jobs():
+    _parse_parts.cache_clear()
+
+    for job_name in ["first-job", "second-job"]:
+        CronExpression.parse(value="1 2 3 4 5", job_name=job_name, tool_name=TOOL_NAME)
+
+    assert _parse_parts.cache_info().currsize == 1
@@ -11,6 +11,7 @@ from tjf.core.error import TjfValidationError
         "underscores_are_not_valid_in_dns",
         "nor..are..double..dots",
         ".or-starting-with-dots",
+        "nor-trailing-newlines\n",
         "a" * 53,
     ],
 )
@@ -39,3 +40,8 @@ def test_valid_jobname(name: str) -> None:
 def test_invalid_cronjob_name(name: str) -> None:
     with pytest.raises(TjfValidationError):
         CommonJob.validate_job_name(name)
+
+
+def test_long_invalid_jobname_reports_length() -> None:
+    with pytest.raises(TjfValidationError, match="can't be longer than"):
+        CommonJob.validate_job_name("a" * 100_000 + "!")
@@ -1,26 +1,49 @@
+import functools
 import json
 from datetime import datetime, timezone
 from pathlib import Path
 
+import httpx
 import pytest
-from requests_mock import Mocker
 from toolforge_weld.logs import LogEntry
 
-from tjf.loki_logs import LokiSource, build_logql
+import tjf.loki_logs
+from tjf.loki_logs import LokiSource, _create_loki_client, build_logql
+
+
+@pytest.fixture
+def loki_requests(
+    monkeypatch: pytest.MonkeyPatch, fixtures_path: Path
+) -> list[httpx.Request]:
+    loki_requests: list[httpx.Request] = []
+    loki_data = json.loads((fixtures_path / "loki" / "loki-data.json").read_text())
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        loki_requests.append(request)
+        return httpx.Response(
+            200, json=loki_data, headers={"Set-Cookie": "session=secret; Path=/"}
+        )
+
+    monkeypatch.setattr(
+        tjf.loki_logs,
+        "_get_loki_client",
+        functools.cache(
+            lambda: _create_loki_client(transport=httpx.MockTransport(handler))
+        ),
+    )
+    return loki_requests
 
 
 def test_build_logql() -> None:
     assert build_logql({"foo": "bar"}) == '{foo="bar"}'
 
 
+def test_build_logql_escapes_values() -> None:
+    assert build_logql({"foo": 'b"a\\r'}) == '{foo="b\\"a\\\\r"}'
+
+
 @pytest.mark.asyncio
-async def test_LokiSource_query_nofollow(
-    requests_mock: Mocker, fixtures_path: Path
-) -> None:
-    requests_mock.get(
-        "http://loki.example:3100/loki/api/v1/query_range?query=%7Bfoo%3D%22bar%22%7D&since=1h&limit=500",
-        json=json.loads((fixtures_path / "loki" / "loki-data.json").read_text()),
-    )
+async def test_LokiSource_query_nofollow(loki_requests: list[httpx.Request]) -> None:
 
     source = LokiSource(
         base_url="http://loki.example:3100/loki",
@@ -106,3 +129,55 @@ async def test_LokiSource_query_nofollow(
             message="Mon Jul  7 12:33:40 PM UTC 2025",
         ),
     ]
+
+
+@pytest.mark.asyncio
+async def test_LokiSource_query_nofollow_sends_the_query(
+    loki_requests: list[httpx.Request],
+) -> None:
+    source = LokiSource(
+        base_url="http://loki.example:3100/loki",
+        tenant="tool-tf-test",
+    )
+
+    [
+        entry
+        async for entry in source.query(
+            selector={"foo": "bar"}, follow=False, lines=None
+        )
+    ]
+
+    assert len(loki_requests) == 1
+    assert loki_requests[0].url.path == "/loki/api/v1/query_range"
+    assert dict(loki_requests[0].url.params) == {
+        "query": '{foo="bar"}',
+        "since": "1h",
+        "limit": "500",
+        "direction": "forward",
+    }
+
+
+@pytest.mark.asyncio
+async def test_LokiSource_query_sends_the_tenant_per_request(
+    loki_requests: list[httpx.Request],
+) -> None:
+    for tenant in ["tool-tf-test", "tool-other"]:
+        source = LokiSource(base_url="http://loki.example:3100/loki", tenant=tenant)
+        [
+            entry
+            async for entry in source.query(
+                selector={"foo": "bar"}, follow=False, lines=None
+            )
+        ]
+
+    assert [request.headers["X-Scope-OrgID"] for request in loki_requests] == [
+        "tool-tf-test",
+        "tool-other",
+    ]
+    assert (
+        loki_requests[0]
+        .headers["User-Agent"]
+        .startswith("jobs-framework-api python-httpx/")
+    )
+    # the cookie set in the response to the first tenant must not be sent for the second
+    assert "Cookie" not in loki_requests[1].headers
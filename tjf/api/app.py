@@ -22,7 +22,12 @@ from .error import error_handler
 from .images import images
 from .jobs import jobs
 from .metrics import get_metrics_app
-from .models import Health, HealthResponse, HealthState, ResponseMessages
+from .models import (
+    EMPTY_RESPONSE_MESSAGES,
+    Health,
+    HealthResponse,
+    HealthState,
+)
 from .openapi import openapi
 from .quotas import quotas
 from .utils import JobsApi
@@ -33,7 +38,7 @@ LOGGER = logging.getLogger(__name__)
 def healthz() -> HealthResponse:
     return HealthResponse(
         health=Health(message="OK", status=HealthState.ok),
-        messages=ResponseMessages(),
+        messages=EMPTY_RESPONSE_MESSAGES,
     )
 
 
@@ -19,11 +19,11 @@ from fastapi import APIRouter, Request
 
 from .auth import ensure_authenticated
 from .models import (
+    EMPTY_RESPONSE_MESSAGES,
     Image,
     ImageListResponse,
-    ResponseMessages,
 )
-from .utils import current_app
+from .utils import current_app, model_json_response
 
 LOGGER = logging.getLogger(__name__)
 
@@ -41,7 +41,9 @@ def api_get_images(request: Request, tool_name: str) -> ImageListResponse:
     ensure_authenticated(request=request)
 
     images_data = current_app(request).core.get_images(tool_name=tool_name)
-    return ImageListResponse(
+    response = ImageListResponse(
         images=[Image.from_image_data(image_data) for image_data in images_data],
-        messages=ResponseMessages(),
+        messages=EMPTY_RESPONSE_MESSAGES,
     )
+    # FastAPI will not re-wrap the response if it's actually a fastapi.Response subclass
+    return model_json_response(response, exclude_unset=True)  # type: ignore
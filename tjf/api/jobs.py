@@ -18,12 +18,13 @@ import http
 import logging
 
 from fastapi import APIRouter, Query, Request
-from fastapi.responses import JSONResponse, Response, StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 
 from ..core.error import TjfValidationError
 from ..core.models import OUT_OF_SYNC_JOB_WARNING_MESSAGE
 from .auth import ensure_authenticated
 from .models import (
+    EMPTY_RESPONSE_MESSAGES,
     AnyDefinedJob,
     AnyNewJob,
     CommonJob,
@@ -36,12 +37,21 @@ from .models import (
     UpdateResponse,
     get_job_for_api,
 )
-from .utils import current_app
+from .utils import current_app, model_json_response
 
 LOGGER = logging.getLogger(__name__)
 
 jobs = APIRouter(prefix="/v1/tool/{tool_name}/jobs", redirect_slashes=False)
 
+# the delete, flush and restart responses only ever carry empty messages, so serialize them once
+EMPTY_MESSAGES_RESPONSE_JSON = FlushResponse(
+    messages=EMPTY_RESPONSE_MESSAGES
+).model_dump_json()
+
+
+def _empty_messages_response() -> Response:
+    return Response(content=EMPTY_MESSAGES_RESPONSE_JSON, media_type="application/json")
+
 
 def _get_warnings_for_jobs_not_up_to_date(
     jobs: list[AnyDefinedJob], messages: ResponseMessages
@@ -75,25 +85,20 @@ def api_get_jobs(
     # If the user requested all fields, we need to compute the missing fields
     # using the same logic we use during runtime creation.
     if include_unset:
-        user_jobs = [job.get_resolved_core_job() for job in user_jobs]
-
-    defined_jobs = [get_job_for_api(job) for job in user_jobs]
+        defined_jobs = [
+            get_job_for_api(job.get_resolved_core_job()) for job in user_jobs
+        ]
+    else:
+        defined_jobs = [get_job_for_api(job) for job in user_jobs]
     response = JobListResponse(
         jobs=defined_jobs,
         messages=_get_warnings_for_jobs_not_up_to_date(
-            jobs=defined_jobs, messages=ResponseMessages()
+            jobs=defined_jobs, messages=EMPTY_RESPONSE_MESSAGES
         ),
     )
-    if include_unset:
-        LOGGER.debug(f"Returning {response}")
-        return response
-    else:
-        # FastAPI will not re-wrap the response if it's actually a fastapi.Response subclass
-        wrapped_response = JSONResponse(
-            content=response.model_dump(exclude_unset=True, mode="json")
-        )
-        LOGGER.debug(f"Returning {wrapped_response}")
-        return wrapped_response  # type: ignore
+    LOGGER.debug("Returning %s", response)
+    # FastAPI will not re-wrap the response if it's actually a fastapi.Response subclass
+    return model_json_response(response, exclude_unset=not include_unset)  # type: ignore
 
 
 @jobs.post("", status_code=http.HTTPStatus.CREATED)
@@ -125,7 +130,7 @@ def api_create_job(request: Request, tool_name: str, new_job: AnyNewJob) -> JobR
     defined_job = get_job_for_api(job=job)
     logging.debug(f"Generated DefinedJob: {defined_job}")
 
-    return JobResponse(job=defined_job, messages=ResponseMessages())
+    return JobResponse(job=defined_job, messages=EMPTY_RESPONSE_MESSAGES)
 
 
 @jobs.patch("")
@@ -152,7 +157,8 @@ def api_flush_job(request: Request, tool_name: str) -> FlushResponse:
     ensure_authenticated(request=request)
 
     current_app(request).core.flush_jobs(tool_name=tool_name)
-    return FlushResponse(messages=ResponseMessages())
+    # FastAPI will not re-wrap the response if it's actually a fastapi.Response subclass
+    return _empty_messages_response()  # type: ignore
 
 
 @jobs.get("/{name}")
@@ -183,19 +189,12 @@ def api_get_job(
     response = JobResponse(
         job=defined_job,
         messages=_get_warnings_for_jobs_not_up_to_date(
-            jobs=[defined_job], messages=ResponseMessages()
+            jobs=[defined_job], messages=EMPTY_RESPONSE_MESSAGES
         ),
     )
-    if include_unset:
-        LOGGER.debug(f"Returning object directly: {response}")
-        return response
-    else:
-        # FastAPI will not re-wrap the response if it's actually a fastapi.Response subclass
-        response = JSONResponse(
-            content=response.model_dump(exclude_unset=True, mode="json")
-        )  # type: ignore
-        LOGGER.debug(f"Wrapping object in JSONResponse: {response}")
-        return response
+    LOGGER.debug("Returning %s", response)
+    # FastAPI will not re-wrap the response if it's actually a fastapi.Response subclass
+    return model_json_response(response, exclude_unset=not include_unset)  # type: ignore
 
 
 @jobs.delete("/{name}")
@@ -203,12 +202,14 @@ def api_get_job(
 def api_delete_job(request: Request, tool_name: str, name: str) -> DeleteResponse:
     ensure_authenticated(request=request)
 
-    job = current_app(request).core.get_job(tool_name=tool_name, name=name)
+    core = current_app(request).core
+    job = core.get_job(tool_name=tool_name, name=name)
     if not job:
         raise TjfValidationError(f"Job '{name}' does not exist", http_status_code=404)
 
-    current_app(request).core.delete_job(job=job)
-    return DeleteResponse(messages=ResponseMessages())
+    core.delete_job(job=job)
+    # FastAPI will not re-wrap the response if it's actually a fastapi.Response subclass
+    return _empty_messages_response()  # type: ignore
 
 
 @jobs.get("/{name}/logs")
@@ -246,10 +247,12 @@ async def api_get_logs(request: Request, tool_name: str, name: str) -> Response:
 def api_restart_job(request: Request, tool_name: str, name: str) -> RestartResponse:
     ensure_authenticated(request=request)
 
-    job = current_app(request).core.get_job(tool_name=tool_name, name=name)
+    core = current_app(request).core
+    job = core.get_job(tool_name=tool_name, name=name)
     if not job:
         raise TjfValidationError(f"Job '{name}' does not exist", http_status_code=404)
 
-    current_app(request).core.restart_job(job=job)
+    core.restart_job(job=job)
 
-    return RestartResponse(messages=ResponseMessages())
+    # FastAPI will not re-wrap the response if it's actually a fastapi.Response subclass
+    return _empty_messages_response()  # type: ignore
@@ -4,10 +4,10 @@ from pathlib import Path
 from typing import Any, Literal, Self, Type
 
 from pydantic import Field, field_validator, model_validator
-from toolforge_weld.kubernetes import MountOption, parse_quantity
+from toolforge_weld.kubernetes import MountOption
 from typing_extensions import Annotated
 
-from tjf.core.utils import format_quantity, parse_and_format_mem
+from tjf.core.utils import parse_and_format_cpu, parse_and_format_mem
 
 from ..core.cron import CronExpression, CronParsingError
 from ..core.error import TjfValidationError
@@ -15,16 +15,15 @@ from ..core.images import Image as ImageData
 from ..core.models import (
     JOBNAME_MAX_LENGTH,
     JOBNAME_PATTERN,
+    AnyHealthCheck,
     BaseModel,
     ContinuousJobStatus,
     EmailOption,
-    HttpHealthCheck,
     JobType,
     OneOffJobStatus,
     PortProtocol,
     Quota,
     ScheduledJobStatus,
-    ScriptHealthCheck,
 )
 from ..core.models import AnyJob as AnyCoreJob
 from ..core.models import CommonJob as CoreCommonJob
@@ -64,7 +63,7 @@ class CommonJob(BaseModel):
     @field_validator("cpu")
     @classmethod
     def cpu_validator(cls, value: str) -> str:
-        return value and format_quantity(quantity_value=parse_quantity(value))
+        return value and parse_and_format_cpu(cpu=value)
 
     @staticmethod
     def validate_job_name(job_name: str) -> str:
@@ -72,20 +71,23 @@ class CommonJob(BaseModel):
             raise TjfValidationError(
                 "Job name is required. See the documentation for the naming rules: https://w.wiki/6YL8",
             )
-        if not JOBNAME_PATTERN.match(job_name):
-            raise TjfValidationError(
-                "Invalid job name. See the documentation for the naming rules: https://w.wiki/6YL8",
-            )
+        # check the length first, so the regex never has to scan arbitrarily long user input
         if len(job_name) > JOBNAME_MAX_LENGTH:
             raise TjfValidationError(
                 f"Invalid job name, it can't be longer than {JOBNAME_MAX_LENGTH} characters. "
                 "See the documentation for the naming rules: https://w.wiki/6YL8",
             )
+        if not JOBNAME_PATTERN.fullmatch(job_name):
+            raise TjfValidationError(
+                "Invalid job name. See the documentation for the naming rules: https://w.wiki/6YL8",
+            )
         return job_name
 
     def to_core_job(self, tool_name: str) -> CoreCommonJob:
         LOGGER.debug(
-            f"CommonJob.to_core_job: got {self} (with set fields {self.model_fields_set})"
+            "CommonJob.to_core_job: got %s (with set fields %s)",
+            self,
+            self.model_fields_set,
         )
         set_job_params = self.model_dump(exclude_unset=True)
 
@@ -101,7 +103,11 @@ class CommonJob(BaseModel):
         }
         my_job = CoreCommonJob.model_validate(params)
         LOGGER.debug(
-            f"Got {self} (set fields {self.model_fields_set}), \ngenerated {my_job} (fields set {my_job.model_fields_set})"
+            "Got %s (set fields %s), \ngenerated %s (fields set %s)",
+            self,
+            self.model_fields_set,
+            my_job,
+            my_job.model_fields_set,
         )
         return my_job
 
@@ -112,9 +118,11 @@ class CommonJob(BaseModel):
         imagename = set_job_params.pop("image")["short_name"]
 
         # remove fields that don't belong in this model
-        for field in list(set_job_params.keys()):
-            if field not in cls.model_fields:
-                set_job_params.pop(field)
+        set_job_params = {
+            field: value
+            for field, value in set_job_params.items()
+            if field in cls.model_fields
+        }
 
         params: dict[str, Any] = {
             "name": name,
@@ -124,7 +132,11 @@ class CommonJob(BaseModel):
 
         my_job = CommonJob.model_validate(params)
         LOGGER.debug(
-            f"Got {core_job} (set fields {core_job.model_fields_set}), \ngenerated {my_job} (set fields {my_job.model_fields_set})"
+            "Got %s (set fields %s), \ngenerated %s (set fields %s)",
+            core_job,
+            core_job.model_fields_set,
+            my_job,
+            my_job.model_fields_set,
         )
         return my_job
 
@@ -144,7 +156,9 @@ class NewOneOffJob(CommonJob, BaseModel):
 
     def to_core_job(self, tool_name: str) -> CoreOneOffJob:
         LOGGER.debug(
-            f"NewOneOffJob.to_core_job: got {self} (with set fields {self.model_fields_set})"
+            "NewOneOffJob.to_core_job: got %s (with set fields %s)",
+            self,
+            self.model_fields_set,
         )
         common_core_fields = (
             super().to_core_job(tool_name=tool_name).model_dump(exclude_unset=True)
@@ -152,13 +166,15 @@ class NewOneOffJob(CommonJob, BaseModel):
         set_fields = self.model_dump(exclude_unset=True)
 
         # remove fields that don't belong in this model
-        for field in list(set_fields.keys()):
-            if field not in CoreOneOffJob.model_fields:
-                set_fields.pop(field)
+        set_fields = {
+            field: value
+            for field, value in set_fields.items()
+            if field in CoreOneOffJob.model_fields
+        }
 
         all_fields = {**set_fields, **common_core_fields}
         my_job = CoreOneOffJob.model_validate(all_fields)
-        LOGGER.debug(f"Got {self}, \ngenerated {my_job}")
+        LOGGER.debug("Got %s, \ngenerated %s", self, my_job)
         return my_job
 
 
@@ -183,7 +199,9 @@ class NewScheduledJob(CommonJob, BaseModel):
 
     def to_core_job(self, tool_name: str) -> CoreScheduledJob:
         LOGGER.debug(
-            f"NewScheduledJob.to_core_job: got {self} (with set fields {self.model_fields_set})"
+            "NewScheduledJob.to_core_job: got %s (with set fields %s)",
+            self,
+            self.model_fields_set,
         )
         common_core_fields = (
             super().to_core_job(tool_name=tool_name).model_dump(exclude_unset=True)
@@ -191,9 +209,11 @@ class NewScheduledJob(CommonJob, BaseModel):
         set_fields = self.model_dump(exclude_unset=True)
 
         # remove fields that don't belong in this model
-        for field in list(set_fields.keys()):
-            if field not in CoreScheduledJob.model_fields:
-                set_fields.pop(field)
+        set_fields = {
+            field: value
+            for field, value in set_fields.items()
+            if field in CoreScheduledJob.model_fields
+        }
 
         schedule = set_fields.pop("schedule")
         # TODO: move the validation to the core layer
@@ -210,7 +230,7 @@ class NewScheduledJob(CommonJob, BaseModel):
 
         all_fields = {**set_fields, **common_core_fields, "schedule": schedule_obj}
         my_job = CoreScheduledJob.model_validate(all_fields)
-        LOGGER.debug(f"Got {self}, \ngenerated {my_job}")
+        LOGGER.debug("Got %s, \ngenerated %s", self, my_job)
         return my_job
 
 
@@ -227,10 +247,9 @@ class NewContinuousJob(CommonJob, BaseModel):
         "port"
     ].default
     port_protocol: PortProtocol = PortProtocol.TCP
-    health_check: ScriptHealthCheck | HttpHealthCheck | None = Field(
-        default=CoreContinuousJob.model_fields["health_check"].default,
-        discriminator="health_check_type",
-    )
+    health_check: AnyHealthCheck | None = CoreContinuousJob.model_fields[
+        "health_check"
+    ].default
 
     @model_validator(mode="after")
     def job_type_validator(self) -> Self:
@@ -240,7 +259,9 @@ class NewContinuousJob(CommonJob, BaseModel):
 
     def to_core_job(self, tool_name: str) -> CoreContinuousJob:
         LOGGER.debug(
-            f"NewContinuousJob.to_core_job: got {self} (with set fields {self.model_fields_set})"
+            "NewContinuousJob.to_core_job: got %s (with set fields %s)",
+            self,
+            self.model_fields_set,
         )
         common_core_fields = (
             super().to_core_job(tool_name=tool_name).model_dump(exclude_unset=True)
@@ -248,14 +269,20 @@ class NewContinuousJob(CommonJob, BaseModel):
         set_fields = self.model_dump(exclude_unset=True)
 
         # remove fields that don't belong in this model
-        for field in list(set_fields.keys()):
-            if field not in CoreContinuousJob.model_fields:
-                set_fields.pop(field)
+        set_fields = {
+            field: value
+            for field, value in set_fields.items()
+            if field in CoreContinuousJob.model_fields
+        }
 
         all_fields = {**set_fields, **common_core_fields}
         my_job = CoreContinuousJob.model_validate(all_fields)
         LOGGER.debug(
-            f"Got {self} (set fields {self.model_fields_set}), \ngenerated {my_job} (set fields {my_job.model_fields_set})"
+            "Got %s (set fields %s), \ngenerated %s (set fields %s)",
+            self,
+            self.model_fields_set,
+            my_job,
+            my_job.model_fields_set,
         )
         return my_job
 
@@ -281,9 +308,11 @@ class DefinedCommonJob(CommonJob):
         image_state = set_core_params.pop("image")["state"]
 
         # remove fields that don't belong in this model
-        for field in list(set_core_params.keys()):
-            if field not in cls.model_fields:
-                set_core_params.pop(field)
+        set_core_params = {
+            field: value
+            for field, value in set_core_params.items()
+            if field in cls.model_fields
+        }
 
         params: dict[str, Any] = {
             **set_core_params,
@@ -294,11 +323,11 @@ class DefinedCommonJob(CommonJob):
 
         my_job = cls.model_validate(params)
         # remove fields that should be skipped when excluding_unset
-        for field in ["status_short", "status_long", "status", "image_state"]:
-            if field in my_job.model_fields_set:
-                my_job.model_fields_set.remove(field)
+        my_job.model_fields_set.difference_update(
+            ["status_short", "status_long", "status", "image_state"]
+        )
 
-        LOGGER.debug(f"Got {core_job}, \ngenerated {my_job}")
+        LOGGER.debug("Got %s, \ngenerated %s", core_job, my_job)
         return my_job
 
 
@@ -322,9 +351,11 @@ class DefinedOneOffJob(DefinedCommonJob, BaseModel):
         image_state = set_core_params.pop("image")["state"]
 
         # remove fields that don't belong in this model
-        for field in list(set_core_params.keys()):
-            if field not in cls.model_fields:
-                set_core_params.pop(field)
+        set_core_params = {
+            field: value
+            for field, value in set_core_params.items()
+            if field in cls.model_fields
+        }
 
         params = {
             "job_type": JobType.ONE_OFF,
@@ -334,11 +365,11 @@ class DefinedOneOffJob(DefinedCommonJob, BaseModel):
         }
         my_job = cls.model_validate(params)
         # remove fields that should be skipped when excluding_unset
-        for field in ["status_short", "status_long", "status", "image_state"]:
-            if field in my_job.model_fields_set:
-                my_job.model_fields_set.remove(field)
+        my_job.model_fields_set.difference_update(
+            ["status_short", "status_long", "status", "image_state"]
+        )
 
-        LOGGER.debug(f"Got {core_job}, \ngenerated {my_job}")
+        LOGGER.debug("Got %s, \ngenerated %s", core_job, my_job)
         return my_job
 
 
@@ -370,9 +401,11 @@ class DefinedScheduledJob(DefinedCommonJob, BaseModel):
         image_state = set_core_params.pop("image")["state"]
 
         # remove fields that don't belong in this model
-        for field in list(set_core_params.keys()):
-            if field not in cls.model_fields:
-                set_core_params.pop(field)
+        set_core_params = {
+            field: value
+            for field, value in set_core_params.items()
+            if field in cls.model_fields
+        }
 
         params: dict[str, Any] = {
             "job_type": JobType.SCHEDULED,
@@ -385,18 +418,17 @@ class DefinedScheduledJob(DefinedCommonJob, BaseModel):
 
         my_job = cls.model_validate(params)
         # remove fields that should be skipped when excluding_unset
-        for field in [
-            "status_short",
-            "status_long",
-            "status",
-            "image_state",
-            "schedule_actual",
-        ]:
-            if field in my_job.model_fields_set:
-                my_job.model_fields_set.remove(field)
-
-        LOGGER.debug(f"Got {core_job}, \ngenerated {my_job}")
-        LOGGER.debug(f"Without unset: {my_job.model_dump(exclude_unset=True)}")
+        my_job.model_fields_set.difference_update(
+            [
+                "status_short",
+                "status_long",
+                "status",
+                "image_state",
+                "schedule_actual",
+            ]
+        )
+
+        LOGGER.debug("Got %s, \ngenerated %s", core_job, my_job)
         return my_job
 
 
@@ -415,10 +447,9 @@ class DefinedContinuousJob(DefinedCommonJob, BaseModel):
     port_protocol: PortProtocol = CoreContinuousJob.model_fields[
         "port_protocol"
     ].default
-    health_check: ScriptHealthCheck | HttpHealthCheck | None = Field(
-        default=CoreContinuousJob.model_fields["health_check"].default,
-        discriminator="health_check_type",
-    )
+    health_check: AnyHealthCheck | None = CoreContinuousJob.model_fields[
+        "health_check"
+    ].default
     status: ContinuousJobStatus = CoreContinuousJob.model_fields["status"].default
 
     @classmethod
@@ -433,9 +464,11 @@ class DefinedContinuousJob(DefinedCommonJob, BaseModel):
         image_state = set_core_params.pop("image")["state"]
 
         # remove fields that don't belong in this model
-        for field in list(set_core_params.keys()):
-            if field not in cls.model_fields:
-                set_core_params.pop(field)
+        set_core_params = {
+            field: value
+            for field, value in set_core_params.items()
+            if field in cls.model_fields
+        }
 
         params: dict[str, Any] = {
             "job_type": JobType.CONTINUOUS,
@@ -446,11 +479,10 @@ class DefinedContinuousJob(DefinedCommonJob, BaseModel):
         }
         my_job = cls.model_validate(params)
         # remove fields that should be skipped when excluding_unset
-        for field in ["status_short", "status_long", "status", "image_state"]:
-            if field in my_job.model_fields_set:
-                my_job.model_fields_set.remove(field)
-        LOGGER.debug(f"Got {core_job}, \ngenerated {my_job}")
-        LOGGER.debug(f"Without unset: {my_job.model_dump(exclude_unset=True)}")
+        my_job.model_fields_set.difference_update(
+            ["status_short", "status_long", "status", "image_state"]
+        )
+        LOGGER.debug("Got %s, \ngenerated %s", core_job, my_job)
         return my_job
 
 
@@ -482,6 +514,11 @@ class ResponseMessages(BaseModel):
     error: list[str] = []
 
 
+# Shared by all the responses that have no messages to avoid building a new one on each request.
+# Don't modify it in place, use model_copy(update=...) instead.
+EMPTY_RESPONSE_MESSAGES = ResponseMessages()
+
+
 class ImageListResponse(BaseModel):
     images: list[Image]
     messages: ResponseMessages
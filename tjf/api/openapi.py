@@ -1,8 +1,10 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
+import functools
+import json
 from pathlib import Path
-from typing import Any
 
 import yaml
+from fastapi.responses import Response
 
 # if we assume this very file is tjf/api/openapi.py
 # then CURDIR.parent.parent should be the root of the repository
@@ -10,8 +12,14 @@ CURDIR = Path(__file__).parent.absolute()
 OPENAPI_YAML_PATH = f"{CURDIR.parent.parent}/openapi/openapi.yaml"
 
 
-def openapi() -> dict[str, Any]:
+@functools.cache
+def _get_openapi_json() -> bytes:
+    # the definition does not change while running, so parse and serialize it only once
     with open(OPENAPI_YAML_PATH, "r") as yaml_file:
         openapi_definition = yaml.safe_load(yaml_file)
 
-    return openapi_definition  # type: ignore
+    return json.dumps(openapi_definition, separators=(",", ":")).encode("utf-8")
+
+
+def openapi() -> Response:
+    return Response(content=_get_openapi_json(), media_type="application/json")
@@ -19,10 +19,10 @@ from fastapi import APIRouter, Request
 from ..core.models import Quota
 from .auth import ensure_authenticated
 from .models import (
+    EMPTY_RESPONSE_MESSAGES,
     QuotaResponse,
-    ResponseMessages,
 )
-from .utils import current_app
+from .utils import current_app, model_json_response
 
 quotas = APIRouter(prefix="/v1/tool/{tool_name}/quotas", redirect_slashes=False)
 
@@ -38,6 +38,9 @@ def api_get_quota(request: Request, tool_name: str) -> QuotaResponse:
     ensure_authenticated(request=request)
     quota_data = current_app(request).core.get_quotas(tool_name=tool_name)
 
-    return QuotaResponse(
-        quota=Quota.from_quota_data(quota_data), messages=ResponseMessages()
+    # both the quota and the messages are already validated models, no need to validate them again
+    response = QuotaResponse.model_construct(
+        quota=Quota.from_quota_data(quota_data), messages=EMPTY_RESPONSE_MESSAGES
     )
+    # FastAPI will not re-wrap the response if it's actually a fastapi.Response subclass
+    return model_json_response(response, exclude_unset=True)  # type: ignore
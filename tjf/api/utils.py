@@ -1,6 +1,8 @@
 from typing import cast
 
 from fastapi import FastAPI
+from fastapi.responses import Response
+from pydantic import BaseModel
 from starlette.requests import Request
 
 from ..core.core import Core
@@ -24,3 +26,16 @@ class JobsApi(FastAPI):
 
 def current_app(request: Request) -> JobsApi:
     return cast(JobsApi, request.app)
+
+
+def model_json_response(model: BaseModel, *, exclude_unset: bool = False) -> Response:
+    """
+    Serialize the model straight to json bytes using pydantic-core.
+
+    FastAPI passes Response instances through untouched, so this skips the dump -> validate -> dump round trip it
+    does when the handler returns the response model itself.
+    """
+    return Response(
+        content=model.model_dump_json(exclude_unset=exclude_unset),
+        media_type="application/json",
+    )
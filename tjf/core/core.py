@@ -15,7 +15,7 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
 import logging
-from collections.abc import Mapping
+from collections.abc import Collection, Mapping
 from typing import AsyncIterator, Tuple
 
 from pydantic.main import IncEx
@@ -37,14 +37,47 @@ from .images import Image, ImageType
 from .models import (
     OUT_OF_SYNC_JOB_WARNING_MESSAGE,
     AnyJob,
+    ContinuousJob,
     JobType,
     OneOffJob,
     QuotaData,
+    ScheduledJob,
 )
 
 LOGGER = logging.getLogger(__name__)
 
 
+JOB_FIELDS_NOT_IN_SYNC: set[str] = {"k8s_object", "status"}
+IMAGE_FIELDS_NOT_IN_SYNC: set[str] = {"exists", "state", "aliases"}
+
+
+def _is_different_job(job: AnyJob, other_job: AnyJob) -> bool:
+    """
+    Same as comparing the dumps of both jobs excluding the fields that are not kept in sync, but stops at the first
+    difference instead of building both dicts.
+    """
+    if type(job) is not type(other_job):
+        return True
+
+    for field_name in type(job).model_fields:
+        if field_name in JOB_FIELDS_NOT_IN_SYNC:
+            continue
+
+        if field_name == "image":
+            for image_field_name in type(job.image).model_fields:
+                if image_field_name in IMAGE_FIELDS_NOT_IN_SYNC:
+                    continue
+                if getattr(job.image, image_field_name) != getattr(
+                    other_job.image, image_field_name
+                ):
+                    return True
+
+        elif getattr(job, field_name) != getattr(other_job, field_name):
+            return True
+
+    return False
+
+
 def _update_storage_job_status_from_runtime(
     storage_job: AnyJob, runtime_job: AnyJob | None
 ) -> AnyJob:
@@ -53,23 +86,22 @@ def _update_storage_job_status_from_runtime(
         storage_job.status_long = runtime_job.status_long
         storage_job.status = runtime_job.status.model_copy()
 
-    to_exclude: Mapping[str, IncEx | bool] = {
-        "k8s_object": True,
-        "status": True,
-        "image": {"exists", "state", "aliases"},
-    }
-
     # Hack due to us manually adding `launcher` to the runtime if not there
     # for buildservice images
     if storage_job.image.type == ImageType.BUILDSERVICE:
         if storage_job.cmd.startswith("launcher ") and runtime_job:
             runtime_job.cmd = f"launcher {runtime_job.cmd}"
 
-    if not runtime_job or runtime_job.model_dump(
-        exclude=to_exclude
-    ) != storage_job.get_resolved_core_job().model_dump(exclude=to_exclude):
+    resolved_storage_job = storage_job.get_resolved_core_job()
+    if not runtime_job or _is_different_job(runtime_job, resolved_storage_job):
+        to_exclude: Mapping[str, IncEx | bool] = {
+            **dict.fromkeys(JOB_FIELDS_NOT_IN_SYNC, True),
+            "image": IMAGE_FIELDS_NOT_IN_SYNC,
+        }
         LOGGER.info(
-            f"Found a different running version than in storage:\nSTORAGE: {storage_job.get_resolved_core_job().model_dump(exclude=to_exclude)}\nRUNTIME: {runtime_job and runtime_job.model_dump(exclude=to_exclude)}"
+            "Found a different running version than in storage:\nSTORAGE: %s\nRUNTIME: %s",
+            resolved_storage_job.model_dump(exclude=to_exclude),
+            runtime_job and runtime_job.model_dump(exclude=to_exclude),
         )
         storage_job.status_long = OUT_OF_SYNC_JOB_WARNING_MESSAGE.format(
             job_name=storage_job.job_name
@@ -86,7 +118,7 @@ class Core:
         self.settings = settings
 
     def _create_storage_job(self, job: AnyJob) -> AnyJob:
-        LOGGER.debug(f"Creating job in storage: {job}")
+        LOGGER.debug("Creating job in storage: %s", job)
         if isinstance(job, OneOffJob):
             # TODO: we are currently treating one-off jobs as ephemeral, so we don't really store them, we might
             # want to change that behavior at some point
@@ -101,7 +133,7 @@ class Core:
             raise TjfError("Unable to save job") from error
 
     def _create_runtime_job(self, job: AnyJob) -> None:
-        LOGGER.debug(f"Creating job in runtime: {job}")
+        LOGGER.debug("Creating job in runtime: %s", job)
         recreate = False
         try:
             self.runtime.create_job(job=job)
@@ -176,21 +208,26 @@ class Core:
             return False
 
         to_exclude = set(["status_short", "status_long", "status", "k8s_object"])
-        are_the_same = existing_job.model_dump(
+        existing_job_dump = existing_job.model_dump(
             exclude_unset=True, exclude=to_exclude
-        ) == new_job.model_dump(exclude_unset=True, exclude=to_exclude)
-        if are_the_same:
+        )
+        new_job_dump = new_job.model_dump(exclude_unset=True, exclude=to_exclude)
+        if existing_job_dump == new_job_dump:
             LOGGER.debug("Got the same job, skipping storage")
             return False
 
         LOGGER.debug(
-            "Got two different jobs:"
-            f"\nEXISTING JOB: {existing_job.model_dump(exclude_unset=True, exclude=to_exclude, mode='json')}"
-            f"\nNEW JOB:      {new_job.model_dump(exclude_unset=True, exclude=to_exclude, mode='json')}"
+            "Got two different jobs:\nEXISTING JOB: %s\nNEW JOB:      %s",
+            existing_job_dump,
+            new_job_dump,
         )
         LOGGER.debug(f"Updating job {new_job.job_name}")
-        self.storage.delete_job(job=new_job)
-        self.storage.create_job(job=new_job)
+        if type(existing_job) is type(new_job):
+            # replace in place, one call and the job never goes missing from storage
+            self.storage.update_job(job=new_job)
+        else:
+            self.storage.delete_job(job=new_job)
+            self.storage.create_job(job=new_job)
         LOGGER.info(f"Job {new_job.job_name} updated in storage")
 
         return True
@@ -213,15 +250,14 @@ class Core:
         lines = None
         if "lines" in request_args:
             try:
-                # Ignore mypy, any type errors will be caught on the next line
-                lines = int(request_args.get("lines"))  # type: ignore[arg-type]
+                lines = int(request_args["lines"])
             except (ValueError, TypeError) as e:
                 raise TjfValidationError("Unable to parse lines as integer") from e
 
         logs = self.runtime.get_logs(
             tool_name=tool_name,
             job_name=job_name,
-            follow=request_args.get("follow", "") == "true",
+            follow=request_args.get("follow") == "true",
             lines=lines,
         )
 
@@ -245,30 +281,79 @@ class Core:
         # should not be needed
         return self.runtime.get_quotas(tool_name=tool_name)
 
-    def get_jobs(self, tool_name: str) -> list[AnyJob]:
+    def _get_runtime_jobs_by_name(
+        self, tool_name: str, job_type: JobType, job_names: Collection[str]
+    ) -> dict[str, AnyJob] | None:
+        runtime_jobs: list[ContinuousJob] | list[ScheduledJob]
+        try:
+            if job_type == JobType.SCHEDULED:
+                runtime_jobs = self.runtime.get_scheduled_jobs(
+                    tool_name=tool_name, job_names=job_names
+                )
+            elif job_type == JobType.CONTINUOUS:
+                runtime_jobs = self.runtime.get_continuous_jobs(
+                    tool_name=tool_name, job_names=job_names
+                )
+            else:
+                raise TjfValidationError(f"Unknown job type {job_type}")
+        except Exception as error:
+            LOGGER.exception(
+                f"Error when retrieving {job_type} jobs for tool {tool_name} from runtime: {error}"
+            )
+            # not an empty dict, so the caller can tell a failure from no jobs found
+            return None
+
+        return {runtime_job.job_name: runtime_job for runtime_job in runtime_jobs}
+
+    def _get_runtime_job(self, tool_name: str, storage_job: AnyJob) -> AnyJob | None:
+        try:
+            if storage_job.job_type == JobType.SCHEDULED:
+                return self.runtime.get_scheduled_job(
+                    job_name=storage_job.job_name, tool_name=tool_name
+                )
+            elif storage_job.job_type == JobType.CONTINUOUS:
+                return self.runtime.get_continuous_job(
+                    job_name=storage_job.job_name, tool_name=tool_name
+                )
+            else:
+                raise TjfValidationError(f"Unknown job type {storage_job.job_type}")
+        except NotFoundInRuntime:
+            pass
+        except Exception as error:
+            LOGGER.exception(
+                f"Error when retrieving job {storage_job.job_name} for tool {tool_name} from runtime: {error}"
+            )
+        return None
+
+    def get_jobs(self, tool_name: str) -> Collection[AnyJob]:
         # Currently storage only has continuous and scheduled jobs
         storage_jobs = self.storage.get_jobs(tool_name=tool_name)
         final_jobs: dict[str, AnyJob] = {}
 
+        job_names_by_type: dict[JobType, set[str]] = {}
         for storage_job in storage_jobs:
-            runtime_job: AnyJob | None = None
-            try:
-                if storage_job.job_type == JobType.SCHEDULED:
-                    runtime_job = self.runtime.get_scheduled_job(
-                        job_name=storage_job.job_name, tool_name=tool_name
-                    )
-                elif storage_job.job_type == JobType.CONTINUOUS:
-                    runtime_job = self.runtime.get_continuous_job(
-                        job_name=storage_job.job_name, tool_name=tool_name
-                    )
-                else:
-                    raise TjfValidationError(f"Unknown job type {storage_job.job_type}")
-            except NotFoundInRuntime:
-                pass
-            except Exception as error:
-                LOGGER.exception(
-                    f"Error when retrieving job {storage_job.job_name} for tool {tool_name} from runtime: {error}"
+            job_names_by_type.setdefault(storage_job.job_type, set()).add(
+                storage_job.job_name
+            )
+
+        # list each kind once for the whole tool instead of once per stored job, so the
+        # reconciliation below is just dict lookups
+        runtime_jobs_by_type = {
+            job_type: self._get_runtime_jobs_by_name(
+                tool_name=tool_name, job_type=job_type, job_names=job_names
+            )
+            for job_type, job_names in job_names_by_type.items()
+        }
+        for storage_job in storage_jobs:
+            runtime_jobs = runtime_jobs_by_type[storage_job.job_type]
+            if runtime_jobs is None:
+                # the listing failed, go job by job so one broken job does not mark all
+                # the others of its kind as out of sync
+                runtime_job = self._get_runtime_job(
+                    tool_name=tool_name, storage_job=storage_job
                 )
+            else:
+                runtime_job = runtime_jobs.get(storage_job.job_name)
 
             final_job = self._reconciliate_storage_and_runtime(
                 runtime_job=runtime_job,
@@ -281,7 +366,8 @@ class Core:
         for job in self.runtime.get_one_off_jobs(tool_name=tool_name):
             final_jobs[job.job_name] = job
 
-        return list(final_jobs.values())
+        # callers only iterate over them, no need to copy them into a new list
+        return final_jobs.values()
 
     def flush_jobs(self, tool_name: str) -> None:
         continuous_and_scheduled_jobs = self.storage.get_jobs(tool_name=tool_name)
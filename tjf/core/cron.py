@@ -1,5 +1,7 @@
+import functools
 import random
 from dataclasses import dataclass
+from typing import Any
 
 from pydantic import BaseModel, ConfigDict
 
@@ -50,7 +52,22 @@ FIELDS: list[CronField] = [
 ]
 
 
-def _assert_value(value: str, field: CronField) -> None:
+# the at-macros split in parts, and the indexes of the parts that are not '*' (that get
+# a random value for each job), so they don't have to be split on every parse
+AT_MAPPING_PARTS: dict[str, tuple[str, ...]] = {
+    macro: tuple(mapped.split(" ")) for macro, mapped in AT_MAPPING.items()
+}
+AT_MAPPING_RANDOM_FIELDS: dict[str, tuple[int, ...]] = {
+    macro: tuple(i for i, part in enumerate(parts) if part != "*")
+    for macro, parts in AT_MAPPING_PARTS.items()
+}
+
+
+# the same few expressions are validated over and over (every create/update of a
+# scheduled job), only valid ones end up cached as errors are raised, not returned
+@functools.lru_cache(maxsize=4096)
+def _assert_value(value: str, field_index: int) -> None:
+    field = FIELDS[field_index]
     for entry in value.split(","):
         if "-" in entry:
             # step is not supported with 'a-b' syntax
@@ -135,6 +152,41 @@ def _assert_value(value: str, field: CronField) -> None:
                 )
 
 
+# the same jobs get their schedule parsed on every get/update, and for the at-macros the
+# result only depends on the seed, so cache the parts (not the mutable model itself);
+# the seed is None for the other expressions, so jobs with the same schedule share an entry
+@functools.lru_cache(maxsize=2048)
+def _parse_parts(value: str, random_seed: str | None) -> tuple[str, ...]:
+    if value.startswith("@"):
+        mapped = AT_MAPPING_PARTS.get(value, None)
+        if not mapped:
+            raise CronParsingError(
+                f'Unable to parse cron expression "{value}": '
+                f"Invalid at-macro '{value}', supported macros are: {', '.join(AT_MAPPING.keys())}"
+            )
+        parts = list(mapped)
+
+        # provide consistent times for the same job, using our own generator so we
+        # don't have to touch (and then reset) the global random state
+        rng = random.Random(random_seed)
+
+        for i in AT_MAPPING_RANDOM_FIELDS[value]:
+            parts[i] = str(rng.randint(FIELDS[i].min, FIELDS[i].max))
+
+    else:
+        parts = [part for part in value.lower().split(" ") if part != ""]
+        if len(parts) != 5:
+            raise CronParsingError(
+                f'Unable to parse cron expression "{value}": '
+                f"Expected to find 5 space-separated values, found {len(parts)}"
+            )
+
+        for i in range(len(FIELDS)):
+            _assert_value(parts[i], i)
+
+    return tuple(parts)
+
+
 class CronExpression(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
@@ -150,40 +202,11 @@ class CronExpression(BaseModel):
 
     @classmethod
     def parse(cls, value: str, job_name: str, tool_name: str) -> "CronExpression":
-        random_seed = f"{tool_name} {job_name}"
-        if value.startswith("@"):
-            mapped = AT_MAPPING.get(value, None)
-            if not mapped:
-                raise CronParsingError(
-                    f'Unable to parse cron expression "{value}": '
-                    f"Invalid at-macro '{value}', supported macros are: {', '.join(AT_MAPPING.keys())}"
-                )
-            parts = mapped.split(" ")
-
-            # provide consistent times for the same job
-            random.seed(random_seed)
-
-            for i, field in enumerate(FIELDS):
-                if parts[i] == "*":
-                    continue
-                parts[i] = str(random.randint(field.min, field.max))
-
-            # reset randomness to a non-deterministic seed
-            random.seed()
-
-        else:
-            parts = [part for part in value.lower().split(" ") if part != ""]
-            if len(parts) != 5:
-                raise CronParsingError(
-                    f'Unable to parse cron expression "{value}": '
-                    f"Expected to find 5 space-separated values, found {len(parts)}"
-                )
-
-            for i, field in enumerate(FIELDS):
-                _assert_value(parts[i], field)
+        random_seed = f"{tool_name} {job_name}" if value.startswith("@") else None
+        parts = _parse_parts(value=value, random_seed=random_seed)
 
         # Create dictionary from array values
-        data = dict(zip(list(cls.model_fields.keys()), [value, *parts]))
+        data = dict(zip(CRON_EXPRESSION_FIELD_NAMES, (value, *parts)))
         return cls.model_validate(data)
 
     @classmethod
@@ -196,7 +219,12 @@ class CronExpression(BaseModel):
             )
 
         # Create dictionary from array values
-        model_fields = list(cls.model_fields.keys())
-        model_values = [configured, *parts]
-        model_params = dict(zip(model_fields, model_values))
-        return cls(**model_params)
+        model_params: dict[str, Any] = dict(
+            zip(CRON_EXPRESSION_FIELD_NAMES, (configured, *parts))
+        )
+        # these come from the k8s objects we created, and are all plain strings, no need to validate them again
+        return cls.model_construct(**model_params)
+
+
+# the field names in declaration order, to map the expression parts to them
+CRON_EXPRESSION_FIELD_NAMES: tuple[str, ...] = tuple(CronExpression.model_fields)
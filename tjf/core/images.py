@@ -14,19 +14,22 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
 
-import copy
 import functools
 import json
 import logging
+import threading
 import urllib.parse
-from dataclasses import dataclass
-from datetime import UTC, datetime, timedelta
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
 from enum import Enum
+from http.cookiejar import DefaultCookiePolicy
 from typing import Any, NamedTuple
 
 import requests
 import yaml
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from toolforge_weld.kubernetes import K8sClient
 from toolforge_weld.kubernetes_config import Kubeconfig
 
@@ -42,6 +45,14 @@ DEFAULT_IMAGE_STATE = "unknown"
 
 HARBOR_CONFIG_PATH = "/etc/jobs-api/harbor.json"
 HARBOR_IMAGE_STATE = "stable"
+# how many repositories of the same project to fetch from harbor at the same time
+HARBOR_MAX_CONCURRENT_REQUESTS = 8
+# how many harbor responses to keep for revalidation, one per project listing or repository
+HARBOR_RESPONSES_CACHE_MAX_SIZE = 1000
+# how many tools can be fetching their harbor images at the same time (unless their names collide)
+HARBOR_IMAGES_CACHE_LOCK_STRIPES = 64
+# the libyaml based loader is much faster, but it's only there if pyyaml was built with it
+YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 @dataclass(frozen=True)
@@ -75,6 +86,9 @@ class ImageUrlParts(NamedTuple):
 
 
 class Image(BaseModel):
+    # the known images are cached and shared between requests (and jobs), so they must not change
+    model_config = ConfigDict(frozen=True)
+
     short_name: str
     type: ImageType | None = None
     aliases: list[str] = []
@@ -92,27 +106,26 @@ class Image(BaseModel):
 
         # extract digest if any
         if "@" in rest:
-            rest, digest = rest.split("@", 1)
-            LOGGER.debug(f"digest: {digest}, rest: {rest}")
+            rest, _, digest = rest.partition("@")
+            LOGGER.debug("digest: %s, rest: %s", digest, rest)
 
         # extract host if any
-        if "/" in rest:
-            potential_host = rest.split("/", 1)[0]
-            if "." in potential_host:
-                host, rest = rest.split("/", 1)
-                LOGGER.debug(f"host: {host}, rest: {rest}")
+        potential_host, slash, potential_rest = rest.partition("/")
+        if slash and "." in potential_host:
+            host, rest = potential_host, potential_rest
+            LOGGER.debug("host: %s, rest: %s", host, rest)
 
         # extract harbor project prefix if any (e.g., "tool-mytool")
-        if "/" in rest and rest.startswith("tool-"):
-            project, rest = rest.split("/", 1)
-            LOGGER.debug(f"project: {project}, rest: {rest}")
+        if rest.startswith("tool-") and "/" in rest:
+            project, _, rest = rest.partition("/")
+            LOGGER.debug("project: %s, rest: %s", project, rest)
 
         # extract tag if any. remaining string is considered image name
         if ":" in rest:
-            name, tag = rest.rsplit(":", 1)
+            name, _, tag = rest.rpartition(":")
         else:
             name = rest
-        LOGGER.debug(f"name: {name}, tag: {tag}")
+        LOGGER.debug("name: %s, tag: %s", name, tag)
 
         path = name
         if project:
@@ -224,13 +237,54 @@ class Image(BaseModel):
         return full_url
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheEntry:
     creation_time: datetime
     images: list[Image]
+    # path -> images with that path (one per tag), to avoid scanning all the images on each lookup
+    images_by_path: dict[str, list[Image]] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.images_by_path = {}
+        for image in self.images:
+            self.images_by_path.setdefault(image.path, []).append(image)
 
 
 HARBOR_IMAGES_CACHE: dict[str, CacheEntry] = {}
+# a fixed set of locks shared by hashing the tool name, so there's no lock to keep per tool
+HARBOR_IMAGES_CACHE_LOCKS = tuple(
+    threading.Lock() for _ in range(HARBOR_IMAGES_CACHE_LOCK_STRIPES)
+)
+
+
+@dataclass(slots=True)
+class HarborResponseCacheEntry:
+    etag: str
+    data: Any
+
+
+@dataclass(slots=True)
+class ImagesData:
+    creation_time: datetime
+    images: list[Image]
+    # any of the names an image can be referred by -> images with that name
+    images_by_name: dict[str, list[Image]] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.images_by_name = _get_prebuilt_images_by_name(images=self.images)
+
+
+# parsed image-config, loaded on first use and then refreshed in the background (see _get_prebuilt_images_data)
+IMAGES_DATA: ImagesData | None = None
+IMAGES_DATA_LOCK = threading.Lock()
+IMAGES_DATA_REFRESH_LOCK = threading.Lock()
+# the last background refresh, kept so it can be waited for
+IMAGES_DATA_REFRESH_THREAD: threading.Thread | None = None
+
+# url -> last response, to revalidate with If-None-Match instead of downloading it again,
+# least recently used first, and capped at HARBOR_RESPONSES_CACHE_MAX_SIZE entries
+HARBOR_RESPONSES_CACHE: OrderedDict[str, HarborResponseCacheEntry] = OrderedDict()
+HARBOR_RESPONSES_CACHE_LOCK = threading.Lock()
 
 
 def _get_harbor_project(tool: str) -> str:
@@ -247,82 +301,130 @@ def _get_harbor_config() -> HarborConfig:
     )
 
 
-@functools.lru_cache(maxsize=None)
-def _get_images_data() -> dict[str, Any]:
+def _parse_prebuilt_image(name: str, image_data: dict[str, Any]) -> Image:
+    container, _, digest = image_data["image"].partition("@")
+    host, path = container.split("/", 1)
+    path, _, tag = path.partition(":")
+    params = dict(
+        type=ImageType.STANDARD,
+        short_name=name,
+        aliases=image_data.get("aliases", []),
+        host=host,
+        path=path,
+        tag=tag or "latest",
+        state=image_data["state"],
+    )
+    # prebuilt images don't have digests for now, this may change in the future
+    if digest:
+        params["digest"] = digest
+
+    return Image(**params)
+
+
+def _parse_prebuilt_images(data: dict[str, Any]) -> list[Image]:
+    return [
+        _parse_prebuilt_image(name=name, image_data=image_data)
+        for name, image_data in data.items()
+        if image_data
+        and image_data.get("image", None)
+        and isinstance(image_data["image"], str)
+    ]
+
+
+def _get_prebuilt_images_by_name(images: list[Image]) -> dict[str, list[Image]]:
+    # keeps the order of the images, so the first matching one is still the one picked
+    images_by_name: dict[str, list[Image]] = {}
+    for image in images:
+        for image_name in {image.path, image.short_name, *image.aliases}:
+            images_by_name.setdefault(image_name, []).append(image)
+    return images_by_name
+
+
+def _get_images_data() -> ImagesData:
+    global IMAGES_DATA
+    if IMAGES_DATA is None:
+        with IMAGES_DATA_LOCK:
+            if IMAGES_DATA is None:
+                IMAGES_DATA = _load_images_data()
+    return IMAGES_DATA
+
+
+def _refresh_images_data_in_background() -> None:
+    global IMAGES_DATA_REFRESH_THREAD
+    # one refresh at a time is enough, the rest of the requests keep using the current data
+    if not IMAGES_DATA_REFRESH_LOCK.acquire(blocking=False):
+        return
+
+    def _refresh_images_data() -> None:
+        global IMAGES_DATA
+        try:
+            IMAGES_DATA = _load_images_data()
+        except Exception:
+            LOGGER.warning(
+                "Failed to refresh the images data, keeping the old one", exc_info=True
+            )
+        finally:
+            IMAGES_DATA_REFRESH_LOCK.release()
+
+    IMAGES_DATA_REFRESH_THREAD = threading.Thread(
+        target=_refresh_images_data, name="images-data-refresh", daemon=True
+    )
+    IMAGES_DATA_REFRESH_THREAD.start()
+
+
+def _wait_for_images_data_refresh() -> None:
+    if IMAGES_DATA_REFRESH_THREAD is not None:
+        IMAGES_DATA_REFRESH_THREAD.join()
+
+
+def _load_images_data() -> ImagesData:
     skip_images = get_settings().skip_images
     if skip_images:
-        return {
-            "datetime": datetime.now().isoformat(),
-            "data": {},
-        }
+        return ImagesData(creation_time=datetime.now(), images=[])
 
     client = K8sClient(
         kubeconfig=Kubeconfig.from_container_service_account(namespace="tf-public"),
         user_agent=USER_AGENT,
     )
     configmap = client.get_object(kind="configmaps", name="image-config")
-    yaml_data = yaml.safe_load(configmap["data"]["images-v1.yaml"])
+    yaml_data = yaml.load(configmap["data"]["images-v1.yaml"], Loader=YAML_SAFE_LOADER)
 
-    return {
-        "datetime": datetime.now().isoformat(),
-        "data": yaml_data,
-    }
+    return ImagesData(
+        creation_time=datetime.now(), images=_parse_prebuilt_images(data=yaml_data)
+    )
 
 
 def _get_prebuilt_images() -> list[Image]:
+    # the images are built once per refresh, the cached list is shared so copy it
+    return list(_get_prebuilt_images_data().images)
+
+
+def _get_prebuilt_images_data() -> ImagesData:
     settings = get_settings()
     refresh_interval = settings.images_config_refresh_interval
     LOGGER.debug("Fetching cached images data")
-    result = copy.deepcopy(_get_images_data())
+    result = _get_images_data()
     refresh_if_older = datetime.now() - refresh_interval
 
-    if datetime.fromisoformat(result["datetime"]) < refresh_if_older:
+    if result.creation_time < refresh_if_older:
+        # the current data is still good enough to answer, don't make the request wait for the refresh
         LOGGER.debug(
-            f"Refreshing images, as the oldest we want is {refresh_if_older} and the last refresh was "
-            f"at {result['datetime']}, cache stats {_get_images_data.cache_info()}"
+            "Refreshing images in the background, as the oldest we want is %s and the last refresh was at %s",
+            refresh_if_older,
+            result.creation_time,
         )
-        _get_images_data.cache_clear()
-        result = _get_images_data()
+        _refresh_images_data_in_background()
     else:
         LOGGER.debug(
-            f"Not refreshing images, as the oldest we want is {refresh_if_older} and the last refresh was "
-            f"at {result['datetime']}, cache stats {_get_images_data.cache_info()}"
+            "Not refreshing images, as the oldest we want is %s and the last refresh was at %s",
+            refresh_if_older,
+            result.creation_time,
         )
 
-    data = result["data"]
-    available_images = []
-
-    for name, image_data in data.items():
-        if (
-            not image_data
-            or not image_data.get("image", None)
-            or not isinstance(image_data["image"], str)
-        ):
-            continue
-
-        container = image_data["image"]
-        host, path = container.split("/", 1)
-        path, tag = path.split(":", 1) if ":" in path else (path, "latest")
-        tag, digest = tag.split("@", 1) if "@" in path else (tag, "")
-        params = dict(
-            type=ImageType.STANDARD,
-            short_name=name,
-            aliases=image_data.get("aliases", []),
-            host=host,
-            path=path,
-            tag=tag,
-            state=image_data["state"],
-        )
-        # prebuilt images don't have digests for now, this may change in the future
-        if digest:
-            params["digest"] = digest
-
-        available_images.append(Image(**params))
-
-    if len(available_images) < 1:
+    if len(result.images) < 1:
         raise TjfError("Empty list of available images")
 
-    return available_images
+    return result
 
 
 def _match_harbor_image(
@@ -338,27 +440,36 @@ def _match_harbor_image(
     if not project:
         return None
 
-    harbor_images = _get_harbor_images(
-        tool_name=tool_name, use_harbor_cache=use_harbor_cache
-    )
+    if name:
+        harbor_images = _get_harbor_repository_images(
+            tool_name=tool_name, name=name, use_harbor_cache=use_harbor_cache
+        )
+    else:
+        harbor_images = _get_harbor_images(
+            tool_name=tool_name, use_harbor_cache=use_harbor_cache
+        )
+    project_prefix = f"{project}/"
+    name_suffix = f"/{name}"
     for image in harbor_images:
         if host and host != image.host:
             continue
-        if project and not image.path.startswith(f"{project}/"):
+        if not image.path.startswith(project_prefix):
             continue
-        if name and not image.path.endswith(f"/{name}"):
+        if name and not image.path.endswith(name_suffix):
             continue
         if tag and image.tag != tag:
             continue
         if digest and image.digest != digest:
             continue
 
-        matched_image = image.model_copy()
         if digest:
-            matched_image.short_name = f"{matched_image.short_name}@{digest}"  # maybe this should be done just before returning to api?
-        else:
-            matched_image.digest = digest
-            matched_image.model_fields_set.remove("digest")
+            # maybe this should be done just before returning to api?
+            return image.model_copy(
+                update={"short_name": f"{image.short_name}@{digest}"}
+            )
+
+        matched_image = image.model_copy(update={"digest": digest})
+        matched_image.model_fields_set.remove("digest")
         return matched_image
     return None
 
@@ -377,20 +488,64 @@ def _match_prebuilt_image(
     ):  # Prebuilt images don't use Harbor project prefixes or digests for now
         return None
 
-    prebuilt_images = _get_prebuilt_images()
+    # Match against known aliases, short names, or the isolated name/path
+    prebuilt_images: list[Image] = _get_prebuilt_images_data().images_by_name.get(
+        path, []
+    )
     for image in prebuilt_images:
         if host and host != image.host:
             continue
         if tag and image.tag != tag:
             continue
 
-        # Match against known aliases, short names, or the isolated name/path
-        if image.path == path or image.short_name == name or name in image.aliases:
-            LOGGER.debug(f"Returning matching prebuilt image: {image}")
-            return image
+        LOGGER.debug("Returning matching prebuilt image: %s", image)
+        return image
     return None
 
 
+@functools.cache
+def _get_harbor_session() -> requests.Session:
+    # shared between requests and threads, so the connections to harbor are kept open and reused
+    session = requests.Session()
+    session.headers["User-Agent"] = (
+        f"jobs-framework-api python-requests/{requests.__version__}"
+    )
+    # the session is shared by all the tools, never keep cookies between requests
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    adapter = requests.adapters.HTTPAdapter(pool_maxsize=HARBOR_MAX_CONCURRENT_REQUESTS)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _get_from_harbor(url: str, params: dict[str, str]) -> Any:
+    headers = {}
+    with HARBOR_RESPONSES_CACHE_LOCK:
+        cached_response = HARBOR_RESPONSES_CACHE.get(url)
+        if cached_response:
+            HARBOR_RESPONSES_CACHE.move_to_end(url)
+    if cached_response:
+        headers["If-None-Match"] = cached_response.etag
+
+    response = _get_harbor_session().get(url, params=params, headers=headers, timeout=5)
+    if cached_response and response.status_code == 304:
+        return cached_response.data
+    response.raise_for_status()
+
+    data = response.json()
+    etag = response.headers.get("ETag")
+    with HARBOR_RESPONSES_CACHE_LOCK:
+        if not etag:
+            HARBOR_RESPONSES_CACHE.pop(url, None)
+            return data
+
+        HARBOR_RESPONSES_CACHE[url] = HarborResponseCacheEntry(etag=etag, data=data)
+        HARBOR_RESPONSES_CACHE.move_to_end(url)
+        while len(HARBOR_RESPONSES_CACHE) > HARBOR_RESPONSES_CACHE_MAX_SIZE:
+            HARBOR_RESPONSES_CACHE.popitem(last=False)
+    return data
+
+
 def _get_harbor_images_for_name(project: str, name: str) -> list[Image]:
     config = _get_harbor_config()
 
@@ -398,75 +553,109 @@ def _get_harbor_images_for_name(project: str, name: str) -> list[Image]:
     encoded_name = urllib.parse.quote_plus(name)
 
     try:
-        response = requests.get(
-            f"{config.protocol}://{config.host}/api/v2.0/projects/{encoded_project}/repositories/{encoded_name}/artifacts",
+        artifacts = _get_from_harbor(
+            url=f"{config.protocol}://{config.host}/api/v2.0/projects/{encoded_project}/repositories/{encoded_name}/artifacts",
             params={
                 # Disable default pagination, return all results
                 "page_size": "0",
             },
-            headers={
-                "User-Agent": f"jobs-framework-api python-requests/{requests.__version__}",
-            },
-            timeout=5,
-        )
-        response.raise_for_status()
-    except requests.exceptions.HTTPError:
-        LOGGER.warning(
-            "Failed to load Harbor tags for %s/%s", project, name, exc_info=True
         )
+    except requests.exceptions.HTTPError as e:
+        if e.response is None or e.response.status_code not in (401, 404):
+            # the repository or the project don't exist, usually typos, don't log those
+            LOGGER.warning(
+                "Failed to load Harbor tags for %s/%s", project, name, exc_info=True
+            )
         return []
 
+    path = f"{project}/{name}"
     images: list[Image] = []
-    for artifact in response.json():
+    for artifact in artifacts:
         if artifact["type"] != "IMAGE":
             continue
         if not artifact["tags"]:
             continue
 
-        for tag in artifact["tags"]:
-            tag_name = tag["name"]
-            digest = artifact["digest"]
-            images.append(
-                Image(
-                    type=ImageType.BUILDSERVICE,
-                    short_name=f"{project}/{name}:{tag_name}",
-                    aliases=[f"{project}/{name}:{tag_name}@{digest}"],
-                    tag=tag_name,
-                    host=config.host,
-                    path=f"{project}/{name}",
-                    state=HARBOR_IMAGE_STATE,
-                    digest=digest,
-                )
+        digest = artifact["digest"]
+        images.extend(
+            Image(
+                type=ImageType.BUILDSERVICE,
+                short_name=f"{path}:{tag['name']}",
+                aliases=[f"{path}:{tag['name']}@{digest}"],
+                tag=tag["name"],
+                host=config.host,
+                path=path,
+                state=HARBOR_IMAGE_STATE,
+                digest=digest,
             )
+            for tag in artifact["tags"]
+        )
 
     return images
 
 
+def _get_fresh_harbor_cache_entry(tool_name: str) -> CacheEntry | None:
+    cache_entry = HARBOR_IMAGES_CACHE.get(tool_name)
+    if not cache_entry:
+        return None
+    if (
+        datetime.now(tz=UTC) - cache_entry.creation_time
+        < get_settings().harbor_cache_ttl
+    ):
+        return cache_entry
+    return None
+
+
+def _get_harbor_repository_images(
+    tool_name: str, name: str, use_harbor_cache: bool
+) -> list[Image]:
+    harbor_project = _get_harbor_project(tool=tool_name)
+    if not use_harbor_cache:
+        # only the artifacts of the one repository are needed, no need to list the whole project
+        return _get_harbor_images_for_name(project=harbor_project, name=name)
+
+    # go through the project-wide cache, so resolving the images of many jobs of the
+    # same tool does not make one harbor request per job
+    cache_entry = _get_harbor_cache_entry(tool_name=tool_name)
+    return cache_entry.images_by_path.get(f"{harbor_project}/{name}", [])
+
+
 def _get_harbor_images(tool_name: str, use_harbor_cache: bool) -> list[Image]:
-    if use_harbor_cache and tool_name in HARBOR_IMAGES_CACHE:
-        cache_entry = HARBOR_IMAGES_CACHE[tool_name]
-        if datetime.now(tz=UTC) - cache_entry.creation_time < timedelta(seconds=5):
-            return copy.deepcopy(cache_entry.images)
+    if not use_harbor_cache:
+        return list(_fetch_harbor_images(tool_name=tool_name).images)
+
+    return list(_get_harbor_cache_entry(tool_name=tool_name).images)
+
+
+def _get_harbor_cache_entry(tool_name: str) -> CacheEntry:
+    cache_entry = _get_fresh_harbor_cache_entry(tool_name=tool_name)
+    if cache_entry:
+        return cache_entry
 
+    # concurrent requests for the same tool wait for the first one to fill the cache,
+    # instead of all of them asking harbor for the same images
+    with HARBOR_IMAGES_CACHE_LOCKS[hash(tool_name) % len(HARBOR_IMAGES_CACHE_LOCKS)]:
+        cache_entry = _get_fresh_harbor_cache_entry(tool_name=tool_name)
+        if cache_entry:
+            return cache_entry
+        return _fetch_harbor_images(tool_name=tool_name)
+
+
+def _fetch_harbor_images(tool_name: str) -> CacheEntry:
     config = _get_harbor_config()
 
     harbor_project = _get_harbor_project(tool=tool_name)
     encoded_project = urllib.parse.quote_plus(harbor_project)
 
     try:
-        response = requests.get(
-            f"{config.protocol}://{config.host}/api/v2.0/projects/{encoded_project}/repositories",
+        repositories = _get_from_harbor(
+            url=f"{config.protocol}://{config.host}/api/v2.0/projects/{encoded_project}/repositories",
             params={
                 "with_tag": "true",
                 # Disable default pagination, return all results
                 "page_size": "0",
             },
-            headers={
-                "User-Agent": f"jobs-framework-api python-requests/{requests.__version__}",
-            },
-            timeout=5,
         )
-        response.raise_for_status()
     except requests.exceptions.HTTPError as e:
         if (not e.response) or e.response.status_code != 401:
             # You seem to get a 401 when the project does not exist for whatever reason
@@ -476,18 +665,40 @@ def _get_harbor_images(tool_name: str, use_harbor_cache: bool) -> list[Image]:
                 harbor_project,
                 exc_info=True,
             )
-        return []
-
+        # not cached, so the next request tries again
+        return CacheEntry(images=[], creation_time=datetime.now(tz=UTC))
+
+    names = [
+        repository["name"][len(harbor_project) + 1 :]
+        for repository in repositories
+        # empty repositories have no tags to fetch, skip their artifacts request
+        if repository.get("artifact_count") != 0
+    ]
     images: list[Image] = []
+    if len(names) > 1:
+        # one request per repository, do them concurrently so we wait only for the slowest one
+        with ThreadPoolExecutor(
+            max_workers=min(len(names), HARBOR_MAX_CONCURRENT_REQUESTS)
+        ) as executor:
+            for name_images in executor.map(
+                functools.partial(_get_harbor_images_for_name, harbor_project), names
+            ):
+                images.extend(name_images)
+    else:
+        for name in names:
+            images.extend(
+                _get_harbor_images_for_name(project=harbor_project, name=name)
+            )
 
-    for repository in response.json():
-        name = repository["name"][len(harbor_project) + 1 :]
-        images.extend(_get_harbor_images_for_name(project=harbor_project, name=name))
-
-    HARBOR_IMAGES_CACHE[tool_name] = CacheEntry(
-        images=images, creation_time=datetime.now(tz=UTC)
-    )
-    return copy.deepcopy(images)
+    now = datetime.now(tz=UTC)
+    # drop the expired entries, so tools that are not used anymore don't stay in memory forever
+    # (list() copies the items at once, other threads might be changing the cache)
+    for cached_tool_name, cache_entry in list(HARBOR_IMAGES_CACHE.items()):
+        if now - cache_entry.creation_time >= get_settings().harbor_cache_ttl:
+            HARBOR_IMAGES_CACHE.pop(cached_tool_name, None)
+    cache_entry = CacheEntry(images=images, creation_time=now)
+    HARBOR_IMAGES_CACHE[tool_name] = cache_entry
+    return cache_entry
 
 
 def get_images(tool_name: str, use_harbor_cache: bool = True) -> list[Image]:
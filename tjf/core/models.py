@@ -24,14 +24,14 @@ from typing import Annotated, Any, Literal, Type
 
 from pydantic import BaseModel as PydanticBaseModel
 from pydantic import ConfigDict, Field, field_validator, model_validator
-from toolforge_weld.kubernetes import MountOption, parse_quantity
+from toolforge_weld.kubernetes import MountOption
 from typing_extensions import Self
 
 from .cron import CronExpression
 from .images import Image, ImageType
 from .utils import (
-    format_quantity,
     get_tool_home,
+    parse_and_format_cpu,
     parse_and_format_mem,
     resolve_filelog_path,
 )
@@ -41,8 +41,9 @@ LOGGER = logging.getLogger(__name__)
 # This is a restriction by Kubernetes:
 # a lowercase RFC 1123 subdomain must consist of lower case alphanumeric
 # characters, '-' or '.', and must start and end with an alphanumeric character
+# (use it with fullmatch(), as "$" would also accept a trailing newline)
 JOBNAME_PATTERN = re.compile(
-    "^[a-z0-9]([-a-z0-9]*[a-z0-9])?([.][a-z0-9]([-a-z0-9]*[a-z0-9])?)*$"
+    "[a-z0-9](?:[-a-z0-9]*[a-z0-9])?(?:[.][a-z0-9](?:[-a-z0-9]*[a-z0-9])?)*"
 )
 
 # Cron jobs have a hard limit of 52 characters.
@@ -106,7 +107,12 @@ class HttpHealthCheck(BaseModel):
     model_config = ConfigDict(populate_by_name=True, serialize_by_alias=True)
 
 
-@dataclass(frozen=True)
+AnyHealthCheck = Annotated[
+    ScriptHealthCheck | HttpHealthCheck, Field(discriminator="health_check_type")
+]
+
+
+@dataclass(frozen=True, slots=True)
 class Command:
     """Class to represenet a job command."""
 
@@ -167,7 +173,7 @@ class CommonJob(PydanticBaseModel):
     tool_name: str
     k8s_object: dict[str, Any] = {}
     memory: str = parse_and_format_mem(JOB_DEFAULT_MEMORY)
-    cpu: str = format_quantity(parse_quantity(JOB_DEFAULT_CPU))
+    cpu: str = parse_and_format_cpu(JOB_DEFAULT_CPU)
     emails: EmailOption = EmailOption.none
     mount: MountOption = MountOption.NONE
     status_short: str | None = "Unknown"
@@ -181,17 +187,17 @@ class CommonJob(PydanticBaseModel):
     @field_validator("cpu")
     @classmethod
     def cpu_validator(cls: Type["CommonJob"], value: str) -> str | None:
-        return value and format_quantity(quantity_value=parse_quantity(value))
+        return value and parse_and_format_cpu(cpu=value)
 
     @model_validator(mode="after")
     def validate_common_job(self) -> Self:
         LOGGER.debug(
-            f"Validating common job: {self} (set fields {self.model_fields_set})"
+            "Validating common job: %s (set fields %s)", self, self.model_fields_set
         )
         # we rely on the image having set the type even if we have not yet verified it's a valid one
         # (see the model validation)
         if (
-            self.image.type != ImageType.BUILDSERVICE
+            self.image.type is not ImageType.BUILDSERVICE
             and "mount" in self.model_fields_set
             and not self.mount.supports_non_buildservice
         ):
@@ -201,18 +207,20 @@ class CommonJob(PydanticBaseModel):
         if (
             self.filelog
             and "mount" in self.model_fields_set
-            and self.mount != MountOption.ALL
+            and self.mount is not MountOption.ALL
         ):
             raise ValueError("File logging is only available with --mount=all")
 
         LOGGER.debug(
-            f"Validated common job, {self} (with set fields {self.model_fields_set})"
+            "Validated common job, %s (with set fields %s)", self, self.model_fields_set
         )
         return self
 
     def get_resolved_core_job(self) -> Self:
         LOGGER.debug(
-            f"CommonJob.get_resolved_core_job(): got {self} (set fields {self.model_fields_set})"
+            "CommonJob.get_resolved_core_job(): got %s (set fields %s)",
+            self,
+            self.model_fields_set,
         )
         # we rely on the image having set the type even if we have not yet verified it's a valid one
         common_job_params = self.model_dump(exclude_unset=True)
@@ -253,7 +261,11 @@ class CommonJob(PydanticBaseModel):
 
         resolved_job = self.model_validate(common_job_params)
         LOGGER.debug(
-            f"Got {self} (set fields {self.model_fields_set}), \nresolved {resolved_job} (set fields {resolved_job.model_fields_set})"
+            "Got %s (set fields %s), \nresolved %s (set fields %s)",
+            self,
+            self.model_fields_set,
+            resolved_job,
+            resolved_job.model_fields_set,
         )
         return resolved_job
 
@@ -287,10 +299,7 @@ class ContinuousJob(CommonJob, BaseModel):
     port: Annotated[int, Field(ge=1, le=65535)] | None = None
     port_protocol: PortProtocol = PortProtocol.TCP
     replicas: int = Field(default=JOB_DEFAULT_REPLICAS, ge=0)
-    health_check: ScriptHealthCheck | HttpHealthCheck | None = Field(
-        default=None,
-        discriminator="health_check_type",
-    )
+    health_check: AnyHealthCheck | None = None
     status: ContinuousJobStatus = ContinuousJobStatus()
 
     @model_validator(mode="after")
@@ -298,7 +307,7 @@ class ContinuousJob(CommonJob, BaseModel):
         self.model_fields_set.add("job_type")
         if (
             self.health_check
-            and self.health_check.health_check_type == HealthCheckType.HTTP
+            and self.health_check.health_check_type is HealthCheckType.HTTP
             and not self.port
         ):
             raise ValueError("Port must be set for HTTP health checks")
@@ -337,18 +346,16 @@ class Quota(BaseModel):
 
     @classmethod
     def from_quota_data(cls: Type["Quota"], quota_data: list[QuotaData]) -> "Quota":
-        quota = cls(categories=[])
-        # size of both QuotaCategoryType and quota_data are limited so nested for-loop is fine
-        for type in QuotaCategoryType:
-            category = QuotaCategory(name=type.value, items=[])
-            for data in quota_data:
-                if data.category == type:
-                    category.items.append(
-                        QuotaEntry(
-                            name=data.name,
-                            limit=data.limit,
-                            used=data.used,
-                        )
-                    )
-            quota.categories.append(category)
-        return quota
+        # one pass over the data, the categories keep the QuotaCategoryType order
+        categories = {
+            type: QuotaCategory(name=type.value, items=[]) for type in QuotaCategoryType
+        }
+        for data in quota_data:
+            categories[data.category].items.append(
+                QuotaEntry(
+                    name=data.name,
+                    limit=data.limit,
+                    used=data.used,
+                )
+            )
+        return cls(categories=list(categories.values()))
@@ -14,6 +14,7 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
 
+import functools
 from decimal import Decimal
 from pathlib import Path
 
@@ -79,12 +80,20 @@ def format_quantity(
     return str(float(different_scale)) + suffix
 
 
+# the same few memory and cpu values are normalized over and over (every job validation),
+# only valid ones end up cached as errors are raised, not returned
+@functools.lru_cache(maxsize=256)
 def parse_and_format_mem(mem: str) -> str:
     return format_quantity(
         quantity_value=parse_quantity(mem), suffix="Gi", quantize="0.000"
     )
 
 
+@functools.lru_cache(maxsize=256)
+def parse_and_format_cpu(cpu: str) -> str:
+    return format_quantity(quantity_value=parse_quantity(cpu))
+
+
 def resolve_filelog_path(path: Path | None, home: Path, default: Path) -> Path:
     if not path:
         return home / default
@@ -1,11 +1,11 @@
-import asyncio
 import functools
 import json
 from datetime import datetime, timezone
+from http.cookiejar import CookieJar, DefaultCookiePolicy
 from typing import Any, AsyncIterator, Iterator
 from urllib.parse import urlencode
 
-import requests
+import httpx
 from pydantic import AnyHttpUrl
 from toolforge_weld.logs import LogEntry
 from websockets.asyncio.client import connect
@@ -13,28 +13,58 @@ from websockets.http11 import USER_AGENT as WEBSOCKETS_UA
 
 from tjf.core.error import TjfValidationError
 
+# LogQL label values are double-quoted strings, using Go escaping rules
+LOGQL_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"'})
+
 
 def build_logql(selector: dict[str, str]) -> str:
     if not selector:
         raise ValueError("At least one selector is required")
 
-    label_values = [f'{key}="{value}"' for key, value in selector.items()]
+    label_values = [
+        f'{key}="{value.translate(LOGQL_ESCAPES)}"' for key, value in selector.items()
+    ]
     return f"{{{','.join(label_values)}}}"
 
 
 def _parse_stream(result: dict[str, Any]) -> Iterator[LogEntry]:
+    # the labels are the same for every value in the stream
+    pod = result["stream"]["pod"]
+    container = result["stream"]["container"]
     for time, message in result.get("values", []):
         yield LogEntry(
-            pod=result["stream"]["pod"],
-            container=result["stream"]["container"],
-            # The Loki API returns timestamps as Unix nanos,
-            # cut last 9 digits to convert to Unix seconds to make the number
-            # small enough for Python int to process
-            datetime=datetime.fromtimestamp(int(time[:-9]), tz=timezone.utc),
+            pod=pod,
+            container=container,
+            # The Loki API returns timestamps as Unix nanos, convert them to
+            # Unix seconds as datetime can't handle a number that big
+            datetime=datetime.fromtimestamp(
+                int(time) // 1_000_000_000, tz=timezone.utc
+            ),
             message=message,
         )
 
 
+def _create_loki_client(
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        headers={"User-Agent": f"jobs-framework-api python-httpx/{httpx.__version__}"},
+        # the client is shared by all the tenants, never keep cookies between requests
+        cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+        transport=transport,
+        # TODO: is this fine?
+        timeout=15,
+    )
+
+
+@functools.cache
+def _get_loki_client() -> httpx.AsyncClient:
+    # a new LokiSource is created for every request, so keep the client (and its
+    # connection pool) around to reuse the connections to loki; the tenant header
+    # is sent per request
+    return _create_loki_client()
+
+
 class LokiSource:
     # https://grafana.com/docs/loki/latest/reference/loki-http-api
 
@@ -48,12 +78,6 @@ class LokiSource:
 
         self.headers = {"X-Scope-OrgID": tenant}
 
-        self.session = requests.Session()
-        self.session.headers["User-Agent"] = (
-            f"jobs-framework-api python-requests/{requests.__version__}"
-        )
-        self.session.headers.update(self.headers)
-
     async def _do_follow(self, logql: str, lines: int) -> AsyncIterator[LogEntry]:
         # Replace http prefix with ws, this also would work for https -> wss
         ws_url = f"ws{str(self.base_url).removeprefix('http')}"
@@ -74,9 +98,10 @@ class LokiSource:
                     for entry in _parse_stream(result):
                         yield entry
 
-    def _do_query(self, logql: str, lines: int) -> Iterator[LogEntry]:
-        response = self.session.get(
+    async def _do_query(self, logql: str, lines: int) -> list[LogEntry]:
+        response = await _get_loki_client().get(
             f"{self.base_url}/api/v1/query_range",
+            headers=self.headers,
             params={
                 "query": logql,
                 # TODO: once fully migrated to Loki, make this customizable for users
@@ -84,13 +109,14 @@ class LokiSource:
                 "limit": str(lines),
                 "direction": "forward",
             },
-            # TODO: is this fine?
-            timeout=15,
         )
         response.raise_for_status()
         data = response.json()
-        for result in data["data"].get("result", []):
-            yield from _parse_stream(result)
+        return [
+            entry
+            for result in data["data"].get("result", [])
+            for entry in _parse_stream(result)
+        ]
 
     async def query(
         self, *, selector: dict[str, str], follow: bool, lines: int | None
@@ -110,14 +136,5 @@ class LokiSource:
             ):
                 yield entry
 
-        # TODO: migrate to some asyncio-native HTTP client library
-        loop = asyncio.get_event_loop()
-        for entry in await loop.run_in_executor(
-            None,
-            functools.partial(
-                self._do_query,
-                logql=build_logql(selector),
-                lines=lines,
-            ),
-        ):
+        for entry in await self._do_query(logql=logql, lines=lines):
             yield entry
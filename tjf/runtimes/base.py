@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Collection
 from typing import AsyncIterator
 
 from ..core.images import Image
@@ -26,10 +27,22 @@ class BaseRuntime(ABC):
     def get_one_off_job(self, *, job_name: str, tool_name: str) -> OneOffJob:
         raise NotImplementedError
 
+    @abstractmethod
+    def get_scheduled_jobs(
+        self, *, tool_name: str, job_names: Collection[str]
+    ) -> list[ScheduledJob]:
+        raise NotImplementedError
+
     @abstractmethod
     def get_scheduled_job(self, *, job_name: str, tool_name: str) -> ScheduledJob:
         raise NotImplementedError
 
+    @abstractmethod
+    def get_continuous_jobs(
+        self, *, tool_name: str, job_names: Collection[str]
+    ) -> list[ContinuousJob]:
+        raise NotImplementedError
+
     @abstractmethod
     def get_continuous_job(self, *, job_name: str, tool_name: str) -> ContinuousJob:
         raise NotImplementedError
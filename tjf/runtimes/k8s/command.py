@@ -10,7 +10,7 @@ COMMAND_STDOUT_PREFIX = "exec 1>>"
 COMMAND_STDERR_PREFIX = "exec 2>>"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GeneratedCommand:
     command: list[str]
     args: list[str] | None
@@ -38,11 +38,11 @@ def get_command_from_k8s(
 
     if command_new_format:
         if filelog or job_version == 1:
-            items = command_spec.split(";")
-            # support user-specified command in the form 'x ; y ; z'
-            user_command = ";".join(items[2:])
-            filelog_stdout = Path(items[0].replace(COMMAND_STDOUT_PREFIX, ""))
-            filelog_stderr = Path(items[1].replace(COMMAND_STDERR_PREFIX, ""))
+            # only split out the redirections, keeps user-specified commands in the form 'x ; y ; z' intact
+            items = command_spec.split(";", 2)
+            user_command = items[2] if len(items) > 2 else ""
+            filelog_stdout = Path(items[0].removeprefix(COMMAND_STDOUT_PREFIX))
+            filelog_stderr = Path(items[1].removeprefix(COMMAND_STDERR_PREFIX))
         else:
             if (
                 len(k8s_command) == len(COMMAND_WRAPPER) + 1
@@ -87,15 +87,13 @@ def get_command_for_k8s(command: Command, is_buildservice: bool) -> GeneratedCom
     if filelog_stdout is None and filelog_stderr is None and is_buildservice:
         return GeneratedCommand(command=shlex.split(command.user_command), args=None)
 
-    wrapped_command = COMMAND_WRAPPER.copy()
-    command_str = ""
-
+    command_parts = []
     if filelog_stdout is not None:
-        command_str += f"{COMMAND_STDOUT_PREFIX}{filelog_stdout};"
+        command_parts.append(f"{COMMAND_STDOUT_PREFIX}{filelog_stdout};")
     if filelog_stderr is not None:
-        command_str += f"{COMMAND_STDERR_PREFIX}{filelog_stderr};"
-    command_str += f"{command.user_command}"
-
-    wrapped_command.append(command_str)
+        command_parts.append(f"{COMMAND_STDERR_PREFIX}{filelog_stderr};")
+    command_parts.append(command.user_command)
 
-    return GeneratedCommand(command=wrapped_command, args=None)
+    return GeneratedCommand(
+        command=[*COMMAND_WRAPPER, "".join(command_parts)], args=None
+    )
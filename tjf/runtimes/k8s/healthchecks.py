@@ -45,6 +45,15 @@ def get_healthcheck_for_k8s(
             return _get_tcp_healthcheck_for_k8s(port=port, port_protocol=port_protocol)
 
 
+def _get_probes_for_k8s(handler: dict[str, Any]) -> dict[str, Any]:
+    # both probes run the same check, so they share the handler instead of
+    # each getting its own copy
+    return {
+        "startupProbe": {**handler, **STARTUP_PROBE_DEFAULTS},
+        "livenessProbe": {**handler, **LIVENESS_PROBE_DEFAULTS},
+    }
+
+
 def _get_script_healthcheck_for_k8s(
     health_check: ScriptHealthCheck, is_buildservice: bool
 ) -> dict[str, Any]:
@@ -53,20 +62,7 @@ def _get_script_healthcheck_for_k8s(
     else:
         command = ["/bin/sh", "-c", health_check.script]
 
-    return {
-        "startupProbe": {
-            "exec": {
-                "command": command,
-            },
-            **STARTUP_PROBE_DEFAULTS,
-        },
-        "livenessProbe": {
-            "exec": {
-                "command": command,
-            },
-            **LIVENESS_PROBE_DEFAULTS,
-        },
-    }
+    return _get_probes_for_k8s({"exec": {"command": command}})
 
 
 def _get_http_healthcheck_for_k8s(
@@ -75,22 +71,7 @@ def _get_http_healthcheck_for_k8s(
     if not port or port_protocol != PortProtocol.TCP:
         return {}
 
-    return {
-        "startupProbe": {
-            "httpGet": {
-                "path": health_check.path,
-                "port": port,
-            },
-            **STARTUP_PROBE_DEFAULTS,
-        },
-        "livenessProbe": {
-            "httpGet": {
-                "path": health_check.path,
-                "port": port,
-            },
-            **LIVENESS_PROBE_DEFAULTS,
-        },
-    }
+    return _get_probes_for_k8s({"httpGet": {"path": health_check.path, "port": port}})
 
 
 def _get_tcp_healthcheck_for_k8s(
@@ -99,17 +80,4 @@ def _get_tcp_healthcheck_for_k8s(
     if not port or port_protocol != PortProtocol.TCP:
         return {}
 
-    return {
-        "startupProbe": {
-            "tcpSocket": {
-                "port": port,
-            },
-            **STARTUP_PROBE_DEFAULTS,
-        },
-        "livenessProbe": {
-            "tcpSocket": {
-                "port": port,
-            },
-            **LIVENESS_PROBE_DEFAULTS,
-        },
-    }
+    return _get_probes_for_k8s({"tcpSocket": {"port": port}})
@@ -35,7 +35,7 @@ from ...core.models import (
     ScheduledJob,
     ScriptHealthCheck,
 )
-from ...core.utils import format_quantity, parse_and_format_mem
+from ...core.utils import parse_and_format_cpu, parse_and_format_mem
 from .command import get_command_for_k8s, get_command_from_k8s
 from .healthchecks import get_healthcheck_for_k8s
 from .labels import generate_labels, labels_selector
@@ -52,6 +52,9 @@ JOB_TTLAFTERFINISHED = 30
 JOB_TERMINATION_GRACE_PERIOD = 15
 JOB_CONTAINER_NAME = "job"
 JOB_PROGRESS_DEADLINE_SECONDS = 600
+# parsed once, as they are compared against every rendered and loaded job
+JOB_DEFAULT_MEMORY_QUANTITY = parse_quantity(JOB_DEFAULT_MEMORY)
+JOB_DEFAULT_CPU_QUANTITY = parse_quantity(JOB_DEFAULT_CPU)
 
 
 LOGGER = getLogger(__name__)
@@ -114,7 +117,7 @@ def get_k8s_cronjob_object(
             "jobTemplate": {
                 "spec": {
                     "template": _get_common_k8s_podtemplate(
-                        job=job, default_cpu_limit=default_cpu_limit
+                        job=job, labels=labels, default_cpu_limit=default_cpu_limit
                     ),
                     "ttlSecondsAfterFinished": JOB_TTLAFTERFINISHED,
                     "backoffLimit": job.retry,
@@ -129,17 +132,8 @@ def get_k8s_cronjob_object(
 
 
 def _get_common_k8s_podtemplate(
-    *, job: AnyJob, default_cpu_limit: str
+    *, job: AnyJob, labels: dict[str, str], default_cpu_limit: str
 ) -> dict[str, Any]:
-    labels = generate_labels(
-        jobname=job.job_name,
-        tool_name=job.tool_name,
-        job_type=job.job_type,
-        filelog=job.filelog,
-        emails=job.emails.value,
-        mount=job.mount,
-    )
-
     command = Command(
         user_command=job.cmd,
         filelog=job.filelog,
@@ -233,7 +227,7 @@ def _get_common_k8s_podtemplate(
 
 
 def _get_deployment_k8s_podtemplate(
-    *, job: ContinuousJob, default_cpu_limit: str
+    *, job: ContinuousJob, labels: dict[str, str], default_cpu_limit: str
 ) -> dict[str, Any]:
     probes = get_healthcheck_for_k8s(
         health_check=job.health_check,
@@ -243,10 +237,11 @@ def _get_deployment_k8s_podtemplate(
     )
 
     podtemplate = _get_common_k8s_podtemplate(
-        job=job, default_cpu_limit=default_cpu_limit
+        job=job, labels=labels, default_cpu_limit=default_cpu_limit
     )
+    container = podtemplate["spec"]["containers"][0]
     ports = {}
-    env = podtemplate["spec"]["containers"][0]["env"]
+    env = container["env"]
     if job.port:
         ports = {
             "ports": [
@@ -256,9 +251,9 @@ def _get_deployment_k8s_podtemplate(
         env = [*env, {"name": "PORT", "value": str(job.port)}]
 
     podtemplate["spec"]["restartPolicy"] = "Always"
-    podtemplate["spec"]["containers"][0].update(probes)
-    podtemplate["spec"]["containers"][0].update(ports)
-    podtemplate["spec"]["containers"][0]["env"] = env
+    container.update(probes)
+    container.update(ports)
+    container["env"] = env
     return podtemplate
 
 
@@ -314,14 +309,14 @@ def _generate_container_resources(
     container_resources: dict[str, Any] = {"requests": {}, "limits": {}}
 
     dec_mem = parse_quantity(job.memory)
-    if dec_mem <= parse_quantity(JOB_DEFAULT_MEMORY):
+    if dec_mem <= JOB_DEFAULT_MEMORY_QUANTITY:
         container_resources["requests"]["memory"] = job.memory
     else:
         container_resources["requests"]["memory"] = str(dec_mem / 2)
     container_resources["limits"]["memory"] = job.memory
 
     dec_cpu = parse_quantity(job.cpu)
-    if dec_cpu == parse_quantity(JOB_DEFAULT_CPU):
+    if dec_cpu == JOB_DEFAULT_CPU_QUANTITY:
         # if using the default, make the limit a bit higher to give the user some leeway
         # half of the current worker size
         container_resources["limits"]["cpu"] = default_cpu_limit
@@ -365,7 +360,7 @@ def get_k8s_deployment_object(
                 "type": strategy,
             },
             "template": _get_deployment_k8s_podtemplate(
-                job=job, default_cpu_limit=default_cpu_limit
+                job=job, labels=labels, default_cpu_limit=default_cpu_limit
             ),
             "selector": {
                 "matchLabels": generate_labels(
@@ -399,7 +394,7 @@ def get_k8s_job_object(job: OneOffJob, default_cpu_limit: str) -> K8S_OBJECT_TYP
         },
         "spec": {
             "template": _get_common_k8s_podtemplate(
-                job=job, default_cpu_limit=default_cpu_limit
+                job=job, labels=labels, default_cpu_limit=default_cpu_limit
             ),
             "ttlSecondsAfterFinished": JOB_TTLAFTERFINISHED,
             "backoffLimit": job.retry,
@@ -447,7 +442,7 @@ def format_logs(entry: LogEntry) -> str:
         {
             "pod": entry.pod,
             "container": entry.container,
-            "datetime": entry.datetime.replace(microsecond=0).isoformat("T"),
+            "datetime": entry.datetime.isoformat("T", timespec="seconds"),
             "message": entry.message,
         }
     )
@@ -455,12 +450,16 @@ def format_logs(entry: LogEntry) -> str:
     return f"{dumped}\n"
 
 
-def get_common_job_from_k8s(
+def get_common_job_params_from_k8s(
     k8s_object: dict[str, Any],
     job_type: JobType,
     default_cpu_limit: str,
     tool_name: str,
-) -> CommonJob:
+) -> dict[str, Any]:
+    """
+    Gets the parameters shared by all the job types, to be validated once together with the
+    type-specific ones by the job type model.
+    """
     # TODO: why not just index the dict directly instead of dict_get_object?
     spec = dict_get_object(k8s_object, "spec")
     if not spec:
@@ -480,34 +479,35 @@ def get_common_job_from_k8s(
     if job_type == JobType.SCHEDULED:
         podspec = spec["jobTemplate"]["spec"]
 
+    container = podspec["template"]["spec"]["containers"][0]
+    labels = metadata["labels"]
+
     job_name = metadata["name"]
     emails = EmailOption(
-        metadata["labels"].get("jobs.toolforge.org/emails", EmailOption.none.value)
-    )
-    mount = MountOption(
-        metadata["labels"].get("toolforge.org/mount-storage", MountOption.NONE)
+        labels.get("jobs.toolforge.org/emails", EmailOption.none.value)
     )
-    imageurl = podspec["template"]["spec"]["containers"][0]["image"]
+    mount = MountOption(labels.get("toolforge.org/mount-storage", MountOption.NONE))
+    imageurl = container["image"]
     image = Image.from_short_name_or_url(
         url_or_name=imageurl,
         tool_name=tool_name,
     )
-    resources = podspec["template"]["spec"]["containers"][0].get("resources", {})
+    resources = container.get("resources", {})
     resources_limits = resources.get("limits", {})
     memory = resources_limits.get("memory", CommonJob.model_fields["memory"].default)
     resources_requests = resources.get("requests", {})
     cpu_limit = resources_limits.get("cpu", default_cpu_limit)
     cpu_request = resources_requests.get("cpu", CommonJob.model_fields["cpu"].default)
-    if parse_quantity(cpu_limit) == parse_quantity(default_cpu_limit) and (
-        parse_quantity(cpu_request)
-        == parse_quantity(CommonJob.model_fields["cpu"].default)
+    if (
+        parse_quantity(cpu_limit) == parse_quantity(default_cpu_limit)
+        and parse_quantity(cpu_request) == JOB_DEFAULT_CPU_QUANTITY
     ):
         cpu = CommonJob.model_fields["cpu"].default
     else:
         cpu = cpu_limit
 
-    k8s_command = podspec["template"]["spec"]["containers"][0]["command"]
-    k8s_arguments = podspec["template"]["spec"]["containers"][0].get("args", [])
+    k8s_command = container["command"]
+    k8s_arguments = container.get("args", [])
     try:
         command = get_command_from_k8s(
             k8s_metadata=metadata, k8s_command=k8s_command, k8s_arguments=k8s_arguments
@@ -527,7 +527,7 @@ def get_common_job_from_k8s(
         user_command = command.user_command
 
     namespace = metadata["namespace"]
-    tool_name = "".join(namespace.split("-", 1)[1:])
+    tool_name = namespace.partition("-")[2]
     params = {
         "job_name": job_name,
         "cmd": user_command,
@@ -540,23 +540,20 @@ def get_common_job_from_k8s(
         "emails": emails,
         "mount": mount,
         "memory": parse_and_format_mem(memory),
-        "cpu": format_quantity(parse_quantity(cpu)),
+        "cpu": parse_and_format_cpu(cpu),
     }
-
-    myjob = CommonJob.model_validate(params)
-    return myjob
+    return params
 
 
 def get_one_off_job_from_k8s_object(
     k8s_object: dict[str, Any], default_cpu_limit: str, tool_name: str
 ) -> OneOffJob:
-    common_job = get_common_job_from_k8s(
+    common_params = get_common_job_params_from_k8s(
         k8s_object=k8s_object,
         job_type=JobType.ONE_OFF,
         default_cpu_limit=default_cpu_limit,
         tool_name=tool_name,
     )
-    set_common_params = common_job.model_dump(exclude_unset=True)
     podspec = dict_get_object(k8s_object, "spec")
     if not podspec:
         raise TjfError(
@@ -564,7 +561,7 @@ def get_one_off_job_from_k8s_object(
             data={"k8s_object": k8s_object},
         )
     retry = podspec.get("backoffLimit", 0)
-    params = {"job_type": JobType.ONE_OFF, "retry": retry, **set_common_params}
+    params = {"job_type": JobType.ONE_OFF, "retry": retry, **common_params}
     my_job = OneOffJob.model_validate(params)
 
     return my_job
@@ -585,13 +582,12 @@ def get_scheduled_job_from_k8s_object(
             "Invalid k8s object, did not contain metadata", data={"k8s_object": object}
         )
 
-    common_job = get_common_job_from_k8s(
+    common_params = get_common_job_params_from_k8s(
         k8s_object=k8s_object,
         job_type=JobType.SCHEDULED,
         default_cpu_limit=default_cpu_limit,
         tool_name=tool_name,
     )
-    set_common_params = common_job.model_dump(exclude_unset=True)
 
     if "annotations" in metadata:
         configured_schedule_str = metadata["annotations"].get(
@@ -609,14 +605,14 @@ def get_scheduled_job_from_k8s_object(
     actual_schedule = str(
         CronExpression.parse(
             value=spec["schedule"],
-            job_name=common_job.job_name,
-            tool_name=common_job.tool_name,
+            job_name=common_params["job_name"],
+            tool_name=common_params["tool_name"],
         )
     )
     configured_schedule = CronExpression.parse(
         value=configured_schedule_str,
-        job_name=common_job.job_name,
-        tool_name=common_job.tool_name,
+        job_name=common_params["job_name"],
+        tool_name=common_params["tool_name"],
     ).text
 
     schedule = CronExpression.from_runtime(
@@ -633,7 +629,7 @@ def get_scheduled_job_from_k8s_object(
         "schedule": schedule,
         "timeout": timeout,
         "retry": retry,
-        **set_common_params,
+        **common_params,
     }
 
     my_job = ScheduledJob.model_validate(params)
@@ -650,7 +646,8 @@ def get_continuous_job_from_k8s_object(
             "Invalid k8s object, did not contain spec", data={"k8s_object": object}
         )
 
-    container_port = podspec["template"]["spec"]["containers"][0].get("ports", [{}])[0]
+    container_spec = podspec["template"]["spec"]["containers"][0]
+    container_port = container_spec.get("ports", [{}])[0]
     port = container_port.get(
         "containerPort", ContinuousJob.model_fields["port"].default
     )
@@ -666,8 +663,8 @@ def get_continuous_job_from_k8s_object(
     health_check: ScriptHealthCheck | HttpHealthCheck | None = (
         ContinuousJob.model_fields["health_check"].default
     )
-    container_spec = podspec["template"]["spec"]["containers"][0]
-    if probe_exec := container_spec.get("startupProbe", {}).get("exec"):
+    startup_probe = container_spec.get("startupProbe", {})
+    if probe_exec := startup_probe.get("exec"):
         if probe_exec["command"][0] == "launcher":
             script = shlex.join(probe_exec["command"][1:])
         elif probe_exec["command"][0:2] == ["/bin/sh", "-c"]:
@@ -676,24 +673,23 @@ def get_continuous_job_from_k8s_object(
             # Fallback, next time the job is recreated it should add the shell wrapper or launcher
             script = shlex.join(probe_exec["command"])
         health_check = ScriptHealthCheck(type=HealthCheckType.SCRIPT, script=script)
-    elif container_spec.get("startupProbe", {}).get("httpGet", None):
-        path = container_spec["startupProbe"]["httpGet"]["path"]
+    elif probe_http_get := startup_probe.get("httpGet", None):
+        path = probe_http_get["path"]
         health_check = HttpHealthCheck(type=HealthCheckType.HTTP, path=path)
 
-    common_job = get_common_job_from_k8s(
+    common_params = get_common_job_params_from_k8s(
         k8s_object=k8s_object,
         job_type=JobType.CONTINUOUS,
         default_cpu_limit=default_cpu_limit,
         tool_name=tool_name,
     )
-    set_common_params = common_job.model_dump(exclude_unset=True)
     params = {
         "job_type": JobType.CONTINUOUS,
         "port": port,
         "port_protocol": port_protocol,
         "health_check": health_check,
         "replicas": replicas,
-        **set_common_params,
+        **common_params,
     }
 
     my_job = ContinuousJob.model_validate(params)
@@ -39,7 +39,7 @@ def validate_job_limits(account: ToolAccount, job: AnyJob) -> None:
         min_limits = limit["min"]
         max_limits = limit["max"]
 
-        if job.cpu:
+        if job.cpu and ("cpu" in min_limits or "cpu" in max_limits):
             parsed_cpu = parse_quantity(job.cpu)
             if "cpu" in min_limits:
                 cpu_min = min_limits["cpu"]
@@ -57,7 +57,7 @@ def validate_job_limits(account: ToolAccount, job: AnyJob) -> None:
                         f"allowed per container ({cpu_max})"
                     )
 
-        if job.memory:
+        if job.memory and ("memory" in min_limits or "memory" in max_limits):
             parsed_memory = parse_quantity(job.memory)
             if "memory" in min_limits:
                 memory_min = min_limits["memory"]
@@ -1,3 +1,6 @@
+import threading
+from collections.abc import Collection
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from http import HTTPStatus
 from logging import getLogger
@@ -62,6 +65,19 @@ from .status_deprecated import refresh_job_long_status, refresh_job_short_status
 LOGGER = getLogger(__name__)
 
 
+@dataclass(slots=True)
+class QuotaCacheEntry:
+    creation_time: datetime
+    quotas: list[QuotaData]
+
+
+# the quota objects rarely change, but the clients tend to ask for them in bursts
+QUOTAS_CACHE: dict[str, QuotaCacheEntry] = {}
+QUOTAS_CACHE_LOCK_STRIPES = 64
+# a fixed set of locks shared by hashing the tool name, so there's no lock to keep per tool
+QUOTAS_CACHE_LOCKS = tuple(threading.Lock() for _ in range(QUOTAS_CACHE_LOCK_STRIPES))
+
+
 def _wrap_in_runtime_exception_and_raise(
     error: requests.HTTPError, job: AnyJob, spec: dict[str, Any]
 ) -> Exception:
@@ -73,10 +89,16 @@ def _wrap_in_runtime_exception_and_raise(
     raise new_error
 
 
+def _get_job_name_label(k8s_object: dict[str, Any]) -> str | None:
+    labels: dict[str, str] = k8s_object["metadata"].get("labels", {})
+    return labels.get("app.kubernetes.io/name")
+
+
 class K8sRuntime(BaseRuntime):
     def __init__(self, *, settings: Settings):
         self.loki_url = settings.loki_url
         self.default_cpu_limit = settings.default_cpu_limit
+        self.quotas_cache_ttl = settings.quotas_cache_ttl
 
     def get_one_off_jobs(self, *, tool_name: str) -> list[OneOffJob]:
         job_list = []
@@ -145,6 +167,51 @@ class K8sRuntime(BaseRuntime):
 
         raise NotFoundInRuntime(f"Unable to find job {job_name} for tool {tool_name}.")
 
+    def _get_scheduled_job_from_k8s_object(
+        self, *, k8s_object: dict[str, Any], tool_account: ToolAccount
+    ) -> ScheduledJob:
+        scheduled_job = get_scheduled_job_from_k8s_object(
+            k8s_object=k8s_object,
+            default_cpu_limit=self.default_cpu_limit,
+            tool_name=tool_account.name,
+        )
+        # TODO: we can probably push the try-except to the status gathering function once we deprecate the
+        # short/long statuses
+        try:
+            refresh_job_short_status(tool_account, scheduled_job)
+            refresh_job_long_status(tool_account, scheduled_job)
+            scheduled_job.status = get_scheduled_job_status(
+                job=scheduled_job, tool_account=tool_account
+            )
+        except Exception as error:
+            LOGGER.exception(
+                f"Exception trying to get the status for {scheduled_job}: {error}"
+            )
+            scheduled_job.status_long = "Failed retrieving status"
+            scheduled_job.status_short = "Toolforge error"
+            scheduled_job.status = ScheduledJobStatus(
+                short=StatusShort.UNKNOWN, messages=[scheduled_job.status_long]
+            )
+        return scheduled_job
+
+    def get_scheduled_jobs(
+        self, *, tool_name: str, job_names: Collection[str]
+    ) -> list[ScheduledJob]:
+        tool_account = ToolAccount(name=tool_name)
+        label_selector = labels_selector(
+            tool_name=tool_account.name, job_type=JobType.SCHEDULED
+        )
+        # gathering the status costs extra API calls, only do it for the jobs asked for
+        return [
+            self._get_scheduled_job_from_k8s_object(
+                k8s_object=k8s_object, tool_account=tool_account
+            )
+            for k8s_object in tool_account.k8s_cli.get_objects(
+                kind=K8sKind.CRONJOBS, label_selector=label_selector
+            )
+            if _get_job_name_label(k8s_object) in job_names
+        ]
+
     def get_scheduled_job(self, *, job_name: str, tool_name: str) -> ScheduledJob:
         tool_account = ToolAccount(name=tool_name)
         for k8s_obj in get_k8s_objects_by_job_name(
@@ -153,32 +220,53 @@ class K8sRuntime(BaseRuntime):
             job_type=JobType.SCHEDULED,
             k8s_kind=K8sKind.CRONJOBS,
         ):
-            scheduled_job = get_scheduled_job_from_k8s_object(
-                k8s_object=k8s_obj,
-                default_cpu_limit=self.default_cpu_limit,
-                tool_name=tool_name,
+            return self._get_scheduled_job_from_k8s_object(
+                k8s_object=k8s_obj, tool_account=tool_account
             )
-            # TODO: we can probably push the try-except to the status gathering function once we deprecate the
-            # short/long statuses
-            try:
-                refresh_job_short_status(tool_account, scheduled_job)
-                refresh_job_long_status(tool_account, scheduled_job)
-                scheduled_job.status = get_scheduled_job_status(
-                    job=scheduled_job, tool_account=tool_account
-                )
-            except Exception as error:
-                LOGGER.exception(
-                    f"Exception trying to get the status for {scheduled_job}: {error}"
-                )
-                scheduled_job.status_long = "Failed retrieving status"
-                scheduled_job.status_short = "Toolforge error"
-                scheduled_job.status = ScheduledJobStatus(
-                    short=StatusShort.UNKNOWN, messages=[scheduled_job.status_long]
-                )
-            return scheduled_job
 
         raise NotFoundInRuntime(f"Unable to find job {job_name} for tool {tool_name}.")
 
+    def _get_continuous_job_from_k8s_object(
+        self, *, k8s_object: dict[str, Any], tool_account: ToolAccount
+    ) -> ContinuousJob:
+        job = get_continuous_job_from_k8s_object(
+            k8s_object=k8s_object,
+            default_cpu_limit=self.default_cpu_limit,
+            tool_name=tool_account.name,
+        )
+        # TODO: we can probably push the try-except to the status gathering function once we deprecate the
+        # short/long statuses
+        try:
+            refresh_job_short_status(tool_account, job)
+            refresh_job_long_status(tool_account, job)
+            job.status = get_continuous_job_status(job=job, tool_account=tool_account)
+        except Exception as error:
+            LOGGER.exception(f"Exception trying to get the status for {job}: {error}")
+            job.status_long = "Failed retrieving status"
+            job.status_short = "Toolforge error"
+            job.status = ContinuousJobStatus(
+                short=StatusShort.UNKNOWN, messages=[job.status_long]
+            )
+        return job
+
+    def get_continuous_jobs(
+        self, *, tool_name: str, job_names: Collection[str]
+    ) -> list[ContinuousJob]:
+        tool_account = ToolAccount(name=tool_name)
+        label_selector = labels_selector(
+            tool_name=tool_account.name, job_type=JobType.CONTINUOUS
+        )
+        # gathering the status costs extra API calls, only do it for the jobs asked for
+        return [
+            self._get_continuous_job_from_k8s_object(
+                k8s_object=k8s_object, tool_account=tool_account
+            )
+            for k8s_object in tool_account.k8s_cli.get_objects(
+                kind=K8sKind.DEPLOYMENTS, label_selector=label_selector
+            )
+            if _get_job_name_label(k8s_object) in job_names
+        ]
+
     def get_continuous_job(self, *, job_name: str, tool_name: str) -> ContinuousJob:
         tool_account = ToolAccount(name=tool_name)
         for k8s_obj in get_k8s_objects_by_job_name(
@@ -187,29 +275,9 @@ class K8sRuntime(BaseRuntime):
             job_type=JobType.CONTINUOUS,
             k8s_kind=K8sKind.DEPLOYMENTS,
         ):
-            job = get_continuous_job_from_k8s_object(
-                k8s_object=k8s_obj,
-                default_cpu_limit=self.default_cpu_limit,
-                tool_name=tool_name,
+            return self._get_continuous_job_from_k8s_object(
+                k8s_object=k8s_obj, tool_account=tool_account
             )
-            # TODO: we can probably push the try-except to the status gathering function once we deprecate the
-            # short/long statuses
-            try:
-                refresh_job_short_status(tool_account, job)
-                refresh_job_long_status(tool_account, job)
-                job.status = get_continuous_job_status(
-                    job=job, tool_account=tool_account
-                )
-            except Exception as error:
-                LOGGER.exception(
-                    f"Exception trying to get the status for {job}: {error}"
-                )
-                job.status_long = "Failed retrieving status"
-                job.status_short = "Toolforge error"
-                job.status = ContinuousJobStatus(
-                    short=StatusShort.UNKNOWN, messages=[job.status_long]
-                )
-            return job
 
         raise NotFoundInRuntime(f"Unable to find job {job_name} for tool {tool_name}.")
 
@@ -360,7 +428,7 @@ class K8sRuntime(BaseRuntime):
         # TODO,REFACTOR: instead of mixing creating multiple k8s objects, have a function for each type of job that
         # creates all the needed objects for that job
         spec = get_job_for_k8s(job=job, default_cpu_limit=self.default_cpu_limit)
-        LOGGER.debug(f"Got k8s spec: {spec}")
+        LOGGER.debug("Got k8s spec: %s", spec)
         return spec
 
     def _create_scheduled_job(
@@ -373,7 +441,7 @@ class K8sRuntime(BaseRuntime):
             kind=K8sKind.CRONJOBS,
             spec=spec,
         )
-        LOGGER.debug(f"Result from k8s: {k8s_result}")
+        LOGGER.debug("Result from k8s: %s", k8s_result)
         job.k8s_object = k8s_result
 
     def _create_continuous_job(
@@ -382,27 +450,27 @@ class K8sRuntime(BaseRuntime):
         spec = get_k8s_deployment_object(
             job=job, default_cpu_limit=self.default_cpu_limit
         )
-        LOGGER.debug(f"Got k8s spec: {spec}")
+        LOGGER.debug("Got k8s spec: %s", spec)
         k8s_result = create_k8s_object_for_job(
             tool_account=tool_account,
             job=job,
             kind=K8sKind.DEPLOYMENTS,
             spec=spec,
         )
-        LOGGER.debug(f"Result from k8s: {k8s_result}")
+        LOGGER.debug("Result from k8s: %s", k8s_result)
         if job.port:
             self._create_service(job=job)
 
     def _create_one_off_job(self, *, job: OneOffJob, tool_account: ToolAccount) -> None:
         spec = get_k8s_job_object(job=job, default_cpu_limit=self.default_cpu_limit)
-        LOGGER.debug(f"Got k8s spec: {spec}")
+        LOGGER.debug("Got k8s spec: %s", spec)
         k8s_result = create_k8s_object_for_job(
             tool_account=tool_account,
             job=job,
             kind=K8sKind.JOBS,
             spec=spec,
         )
-        LOGGER.debug(f"Result from k8s: {k8s_result}")
+        LOGGER.debug("Result from k8s: %s", k8s_result)
         job.k8s_object = k8s_result
 
     def create_job(self, *, job: AnyJob) -> None:
@@ -495,7 +563,41 @@ class K8sRuntime(BaseRuntime):
                 return self._delete_one_off_job(job=job, wait_for_pods=wait_for_pods)
         raise TjfError(f"Unknown job type {job.job_type}")
 
+    def _get_fresh_quotas_cache_entry(
+        self, *, tool_name: str
+    ) -> QuotaCacheEntry | None:
+        cache_entry = QUOTAS_CACHE.get(tool_name)
+        if (
+            cache_entry
+            and datetime.now(tz=timezone.utc) - cache_entry.creation_time
+            < self.quotas_cache_ttl
+        ):
+            return cache_entry
+        return None
+
     def get_quotas(self, *, tool_name: str) -> list[QuotaData]:
+        cache_entry = self._get_fresh_quotas_cache_entry(tool_name=tool_name)
+        if cache_entry:
+            return [quota.model_copy() for quota in cache_entry.quotas]
+
+        # concurrent requests for the same tool wait for the first one to fill the cache,
+        # instead of all of them asking k8s for the same quotas
+        with QUOTAS_CACHE_LOCKS[hash(tool_name) % len(QUOTAS_CACHE_LOCKS)]:
+            cache_entry = self._get_fresh_quotas_cache_entry(tool_name=tool_name)
+            if cache_entry:
+                return [quota.model_copy() for quota in cache_entry.quotas]
+
+            quotas = self._get_quotas(tool_name=tool_name)
+            now = datetime.now(tz=timezone.utc)
+            # drop the expired entries, so tools that are not used anymore don't stay in memory forever
+            # (list() copies the items at once, other threads might be changing the cache)
+            for cached_tool_name, cache_entry in list(QUOTAS_CACHE.items()):
+                if now - cache_entry.creation_time >= self.quotas_cache_ttl:
+                    QUOTAS_CACHE.pop(cached_tool_name, None)
+            QUOTAS_CACHE[tool_name] = QuotaCacheEntry(creation_time=now, quotas=quotas)
+        return [quota.model_copy() for quota in quotas]
+
+    def _get_quotas(self, *, tool_name: str) -> list[QuotaData]:
         tool_account = ToolAccount(name=tool_name)
         resource_quota = tool_account.k8s_cli.get_object(
             kind=K8sKind.RESOURCE_QUOTAS, name=tool_account.namespace
@@ -11,6 +11,10 @@ log = logging.getLogger(__name__)
 class Settings(BaseSettings):
     debug: bool = False
     images_config_refresh_interval: datetime.timedelta = datetime.timedelta(hours=1)
+    # how long the harbor images of a tool are reused before asking harbor again
+    harbor_cache_ttl: datetime.timedelta = datetime.timedelta(seconds=5)
+    # how long the quotas of a tool are reused before asking k8s again, 0 disables it
+    quotas_cache_ttl: datetime.timedelta = datetime.timedelta(seconds=5)
     skip_metrics: bool = False
     skip_images: bool = False
     loki_url: AnyHttpUrl = AnyHttpUrl("http://loki-tools.loki.svc:3100/loki")
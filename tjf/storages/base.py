@@ -35,6 +35,10 @@ class BaseStorage(ABC):
     def create_job(self, *, job: AnyJob) -> AnyJob:
         raise NotImplementedError
 
+    @abstractmethod
+    def update_job(self, *, job: AnyJob) -> AnyJob:
+        raise NotImplementedError
+
     @abstractmethod
     def delete_jobs(self, *, tool_name: str, jobs: list[AnyJob]) -> list[AnyJob]:
         raise NotImplementedError
@@ -16,6 +16,7 @@ from logging import getLogger
 from typing import Any, Type, TypeAlias
 
 import kubernetes  # type: ignore
+from fastapi import status
 
 from tjf.settings import Settings
 
@@ -112,15 +113,15 @@ class K8sStorage(BaseStorage):
     def get_job(self, *, job_name: str, tool_name: str) -> AnyJob:
         LOGGER.debug("Getting job %s for tool %s", job_name, tool_name)
 
-        all_jobs = self.get_jobs(tool_name=tool_name)
-        maybe_job = next((job for job in all_jobs if job.job_name == job_name), None)
+        # look at one kind at a time, so we skip the rest of the list calls once found
+        for job_class in (ContinuousJob, ScheduledJob):
+            for job in self._get_jobs(tool_name=tool_name, job_class=job_class):
+                if job.job_name == job_name:
+                    return job
 
-        if not maybe_job:
-            raise NotFoundInStorage(
-                f"No job with name '{job_name}' found for tool {tool_name}"
-            )
-
-        return maybe_job
+        raise NotFoundInStorage(
+            f"No job with name '{job_name}' found for tool {tool_name}"
+        )
 
     def get_jobs(self, *, tool_name: str) -> list[AnyJob]:
         LOGGER.debug("Getting all jobs for tool %s", tool_name)
@@ -130,7 +131,7 @@ class K8sStorage(BaseStorage):
         jobs.extend(self._get_jobs(tool_name=tool_name, job_class=ScheduledJob))
         # TODO: get also one-off jobs when they are supported in storage
 
-        LOGGER.debug(f"Got jobs {jobs} for tool {tool_name}")
+        LOGGER.debug("Got jobs %s for tool %s", jobs, tool_name)
         return jobs
 
     def create_job(self, *, job: AnyJob) -> AnyJob:
@@ -150,6 +151,43 @@ class K8sStorage(BaseStorage):
 
         return job
 
+    def update_job(self, *, job: AnyJob) -> AnyJob:
+        LOGGER.debug("Updating job %s for tool %s", job.job_name, job.tool_name)
+        _, k8s_plural = _get_kind_and_plural_from_job_class(job_class=job.__class__)
+        namespace = _get_k8s_tool_namespace(tool_name=job.tool_name)
+        body = _job_to_k8s_crd(job=job)
+        try:
+            # custom resources can't be replaced without a resourceVersion, and having it
+            # makes the api server reject the replace if someone changed the job meanwhile
+            current_k8s_object = self.k8s_cli.get_namespaced_custom_object(
+                group=API_GROUP,
+                version=API_VERSION,
+                plural=k8s_plural,
+                namespace=namespace,
+                name=job.job_name,
+            )
+            body["metadata"]["resourceVersion"] = current_k8s_object["metadata"][
+                "resourceVersion"
+            ]
+            self.k8s_cli.replace_namespaced_custom_object(
+                group=API_GROUP,
+                version=API_VERSION,
+                plural=k8s_plural,
+                namespace=namespace,
+                name=job.job_name,
+                body=body,
+            )
+        except kubernetes.client.ApiException as error:
+            if error.status == status.HTTP_409_CONFLICT:
+                raise StorageError(
+                    f"Job {job.job_name} was changed while updating it, try again",
+                    http_status_code=status.HTTP_409_CONFLICT,
+                    data={"k8s_object": body, "k8s_error": str(error)},
+                ) from error
+            raise get_storage_error(error=error, spec=body, action="update a job")
+
+        return job
+
     def delete_jobs(self, *, tool_name: str, jobs: list[AnyJob]) -> list[AnyJob]:
         LOGGER.debug(f"Deleting {len(jobs)} jobs for tool {tool_name}")
         for job in jobs: